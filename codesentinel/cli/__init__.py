@@ -1197,8 +1197,10 @@ except KeyboardInterrupt:
                     if not dry_run:
                         try:
                             import subprocess
-                            subprocess.run(['git', 'gc', '--auto'], check=False, 
-                                         capture_output=not verbose)
+                            # Quiet mode discards the output: send it to the null device
+                            sink = None if verbose else subprocess.DEVNULL
+                            subprocess.run(['git', 'gc', '--auto'], check=False,
+                                         stdout=sink, stderr=sink)
                             print("  [OK] Git garbage collection completed")
                         except Exception as e:
                             print(f"  Git optimization failed: {e}")
@@ -1272,8 +1274,10 @@ except KeyboardInterrupt:
                 print("\nRunning git optimization...")
                 try:
                     import subprocess
-                    result = subprocess.run(['git', 'gc', '--auto'], 
-                                          capture_output=not verbose, text=True)
+                    # Only the return code is used: quiet mode discards the output
+                    sink = None if verbose else subprocess.DEVNULL
+                    result = subprocess.run(['git', 'gc', '--auto'],
+                                          stdout=sink, stderr=sink)
                     if result.returncode == 0:
                         print("  [OK] Git garbage collection completed")
                     else:
@@ -414,6 +414,45 @@ def verify_and_fix_documentation_pipeline(file_paths: List[Path], dry_run: bool
     return results
 
 
+# [remote "origin"] section body, up to the next section header
+# Section and key names are case-insensitive; [remote.origin] is the legacy spelling
+_ORIGIN_SECTION_RE = re.compile(r'^\s*\[remote(?:\s+"origin"|\.origin)\]\s*$(.*?)(?=^\s*\[|\Z)',
+                                re.MULTILINE | re.DOTALL | re.IGNORECASE)
+_URL_KEY_RE = re.compile(r'^\s*url\s*=\s*(.+?)\s*$', re.MULTILINE | re.IGNORECASE)
+# Any section header that could be the origin remote, however it is written
+_ANY_ORIGIN_HEADER_RE = re.compile(r'^\s*\[\s*remote\b[^\]]*origin', re.MULTILINE | re.IGNORECASE)
+
+
+def _read_origin_url(project_root: Path) -> Optional[str]:
+    """
+    Read remote.origin.url straight from .git/config without spawning git.
+
+    Returns:
+        The URL ('' when no origin is configured), or None when the config
+        cannot be read in-process (worktrees, submodules, includes, or an
+        origin entry this parser does not handle) and git must be asked.
+    """
+    config_path = project_root / '.git' / 'config'
+    if not config_path.is_file():
+        return None
+    try:
+        content = config_path.read_text(encoding='utf-8')
+    except (OSError, UnicodeDecodeError):
+        return None
+    if '[include' in content.lower():
+        # Included files may define the remote; let git resolve them
+        return None
+    sections = _ORIGIN_SECTION_RE.findall(content)
+    if not sections:
+        # No origin at all, unless a header we cannot parse might be one
+        return None if _ANY_ORIGIN_HEADER_RE.search(content) else ''
+    urls = [url for section in sections for url in _URL_KEY_RE.findall(section)]
+    if len(urls) != 1 or any(ch in urls[0] for ch in '"\\;#'):
+        # Missing, repeated, quoted, escaped or commented values: let git decide
+        return None
+    return urls[0]
+
+
 def detect_project_info() -> dict:
     """
     Intelligently detect project and repository information.
@@ -491,14 +530,16 @@ def detect_project_info() -> dict:
         except Exception:
             pass
     
-    # Try to detect from git remote
+    # Try to detect from git remote (read in-process; git is only spawned as a fallback)
     try:
-        git_url = subprocess.check_output(
-            ['git', 'config', '--get', 'remote.origin.url'],
-            cwd=project_root,
-            stderr=subprocess.DEVNULL,
-            text=True
-        ).strip()
+        git_url = _read_origin_url(project_root)
+        if git_url is None:
+            git_url = subprocess.check_output(
+                ['git', 'config', '--get', 'remote.origin.url'],
+                cwd=project_root,
+                stderr=subprocess.DEVNULL,
+                text=True
+            ).strip()
         if git_url:
             info['repo_url'] = git_url
             # Extract repo name from URL
@@ -2,41 +2,100 @@
 from codesentinel.utils.document_formatter import FormattingScheme
 import tkinter as tk
 from tkinter import ttk
+import tkinter.font as tkfont
 from typing import Dict, Any, Optional, Callable
 
+# Named fonts shared by every widget in this module
+_FONT_HINT = 'FormatHint'
+_FONT_HINT_ITALIC = 'FormatHintItalic'
+_FONT_HEADING = 'FormatHeading'
+_FONT_SPECS = {
+    _FONT_HINT: {'family': 'Arial', 'size': 8},
+    _FONT_HINT_ITALIC: {'family': 'Arial', 'size': 8, 'slant': 'italic'},
+    _FONT_HEADING: {'family': 'Arial', 'size': 9, 'weight': 'bold'},
+}
+
+
+def _register_fonts(widget):
+    """Create this module's named fonts once per Tk root.
+
+    Tk resolves a named font once; tuple specs are re-parsed per widget.
+    """
+    root = widget._root()
+    if getattr(root, '_cs_format_fonts', None) is None:
+        # Keep references: Tk deletes a named font when its Font object is collected
+        root._cs_format_fonts = [tkfont.Font(root, name=name, **opts)
+                                 for name, opts in _FONT_SPECS.items()]
+
+# Widget class -> whether it has a 'state' option (frames do not); asked of Tk once per class
+_HAS_STATE: Dict[type, bool] = {}
+
+
+def _has_state(widget) -> bool:
+    """True if ``widget`` can be enabled/disabled through its 'state' option."""
+    cls = type(widget)
+    known = _HAS_STATE.get(cls)
+    if known is None:
+        known = _HAS_STATE[cls] = 'state' in widget.keys()
+    return known
+
+
+# Customization fields: (setting key, label, kind, default, spin range or choices, unit)
+_BASIC_FIELDS = (
+    ('max_line_length', "Max line length:", 'spin', 80, (60, 200), "chars"),
+    ('quote_style', "Quote style:", 'choice', 'double', ('single', 'double', 'preserve'), None),
+    ('indent_spaces', "Indentation:", 'spin', 4, (2, 8), "spaces"),
+)
+_BLANK_LINE_FIELDS = (
+    ('blank_lines_after_method', "After method:", 'spin', 1, (0, 3), None),
+    ('blank_lines_after_class', "After class:", 'spin', 2, (0, 3), None),
+)
+# Advanced toggles: (setting key, label, default)
+_ADVANCED_TOGGLES = (
+    ('space_around_operators', "Space around operators", True),
+    ('remove_trailing_whitespace', "Remove trailing whitespace", True),
+    ('ensure_final_newline', "Ensure final newline", True),
+)
+
 class FormattingSchemeSelector(tk.Frame):
+    # (radio label, scheme key, description), one row each
+    SCHEMES = (
+        (' Black', 'black', 'Python - Uncompromising formatter'),
+        (' AutoPEP8', 'autopep8', 'Python - PEP8 compliant'),
+        (' Ruff', 'ruff', 'Python - Fast modern linter'),
+        ('++ C++', 'cpp', 'Google C++ style guide'),
+        (' Google', 'google', 'General documentation style'),
+        ('⚙️ Custom', 'custom', 'Define your own rules'),
+    )
+
     def __init__(self, parent, compact=False, **kwargs):
         super().__init__(parent, **kwargs)
+        _register_fonts(self)
         self.compact = compact
         self.current_scheme = tk.StringVar(value='black')
         
-        schemes = [
-            (' Black', 'black', 'Python - Uncompromising formatter'),
-            (' AutoPEP8', 'autopep8', 'Python - PEP8 compliant'),
-            (' Ruff', 'ruff', 'Python - Fast modern linter'),
-            ('++ C++', 'cpp', 'Google C++ style guide'),
-            (' Google', 'google', 'General documentation style'),
-            ('⚙️ Custom', 'custom', 'Define your own rules')
-        ]
-        
-        for name, key, desc in schemes:
-            frame = tk.Frame(self, bg='#f8f8f8', relief=tk.FLAT, bd=1)
-            frame.pack(fill=tk.X, pady=2)
-            
-            inner = ttk.Frame(frame)
-            inner.pack(fill=tk.X, padx=6, pady=4)
-            
-            rb = ttk.Radiobutton(inner, text=name, variable=self.current_scheme, 
-                                value=key, command=lambda k=key: self._on_change(k))
-            rb.pack(side=tk.LEFT)
-            
-            ttk.Label(inner, text=desc, font=('Arial', 8), foreground='gray').pack(side=tk.LEFT, padx=8)
+        # Radio + description cells placed straight on the selector's grid:
+        # no per-row container frames to create or lay out
+        for row, (name, key, desc) in enumerate(self.SCHEMES):
+            ttk.Radiobutton(self, text=name, variable=self.current_scheme, value=key).grid(
+                row=row, column=0, sticky=tk.W, padx=(6, 0), pady=4)
+            ttk.Label(self, text=desc, font=_FONT_HINT, foreground='gray').grid(
+                row=row, column=1, sticky=tk.W, padx=8, pady=4)
+        self.columnconfigure(1, weight=1)
         
         self.on_scheme_change = None
+        # Any write (click or programmatic set) notifies once, at idle time
+        self._change_pending = None
+        self.current_scheme.trace_add('write', self._schedule_change)
+    
+    def _schedule_change(self, *_):
+        if self._change_pending is None:
+            self._change_pending = self.after_idle(self._on_change)
     
-    def _on_change(self, scheme):
+    def _on_change(self):
+        self._change_pending = None
         if self.on_scheme_change:
-            self.on_scheme_change(scheme)
+            self.on_scheme_change(self.current_scheme.get())
     
     def get_scheme(self):
         return self.current_scheme.get()
@@ -44,8 +103,11 @@ class FormattingSchemeSelector(tk.Frame):
 class FormattingCustomizationPanel(tk.Frame):
     def __init__(self, parent, **kwargs):
         super().__init__(parent, **kwargs)
+        _register_fonts(self)
         self.setting_vars = {}
         self.custom_locked = True
+        # Lock state last pushed to the widgets; None until the first set_scheme
+        self._applied_lock: Optional[bool] = None
         
         # Container
         container = ttk.Frame(self)
@@ -62,108 +124,80 @@ class FormattingCustomizationPanel(tk.Frame):
         basic_frame = ttk.LabelFrame(left, text="⚙️ Basic Settings", padding=10)
         basic_frame.pack(fill=tk.BOTH, expand=True)
         
-        # Line length
-        f1 = ttk.Frame(basic_frame)
-        f1.pack(fill=tk.X, pady=5)
-        ttk.Label(f1, text="Max line length:", width=16).pack(side=tk.LEFT)
-        v1 = tk.IntVar(value=80)
-        self.setting_vars['max_line_length'] = v1
-        ttk.Spinbox(f1, from_=60, to=200, textvariable=v1, width=6).pack(side=tk.LEFT, padx=3)
-        ttk.Label(f1, text="chars", font=('Arial', 8), foreground='gray').pack(side=tk.LEFT)
-        
-        # Quote style
-        f2 = ttk.Frame(basic_frame)
-        f2.pack(fill=tk.X, pady=5)
-        ttk.Label(f2, text="Quote style:", width=16).pack(side=tk.LEFT)
-        v2 = tk.StringVar(value='double')
-        self.setting_vars['quote_style'] = v2
-        ttk.Combobox(f2, textvariable=v2, values=['single','double','preserve'], 
-                     state='readonly', width=12).pack(side=tk.LEFT, padx=3)
-        
-        # Indentation
-        f5 = ttk.Frame(basic_frame)
-        f5.pack(fill=tk.X, pady=5)
-        ttk.Label(f5, text="Indentation:", width=16).pack(side=tk.LEFT)
-        v6 = tk.IntVar(value=4)
-        self.setting_vars['indent_spaces'] = v6
-        ttk.Spinbox(f5, from_=2, to=8, textvariable=v6, width=6).pack(side=tk.LEFT, padx=3)
-        ttk.Label(f5, text="spaces", font=('Arial', 8), foreground='gray').pack(side=tk.LEFT)
+        for spec in _BASIC_FIELDS:
+            self._add_field(basic_frame, *spec, label_width=16, pady=5)
         
         # Right: Advanced Settings
         adv_frame = ttk.LabelFrame(right, text=" Advanced Settings", padding=10)
         adv_frame.pack(fill=tk.BOTH, expand=True)
         
-        # Operator spacing
-        v3 = tk.BooleanVar(value=True)
-        self.setting_vars['space_around_operators'] = v3
-        ttk.Checkbutton(adv_frame, text="Space around operators", variable=v3).pack(anchor=tk.W, pady=3)
-        
-        # Trailing whitespace
-        v7 = tk.BooleanVar(value=True)
-        self.setting_vars['remove_trailing_whitespace'] = v7
-        ttk.Checkbutton(adv_frame, text="Remove trailing whitespace", variable=v7).pack(anchor=tk.W, pady=3)
-        
-        # Final newline
-        v8 = tk.BooleanVar(value=True)
-        self.setting_vars['ensure_final_newline'] = v8
-        ttk.Checkbutton(adv_frame, text="Ensure final newline", variable=v8).pack(anchor=tk.W, pady=3)
+        for key, label, default in _ADVANCED_TOGGLES:
+            var = tk.BooleanVar(value=default)
+            self.setting_vars[key] = var
+            ttk.Checkbutton(adv_frame, text=label, variable=var).pack(anchor=tk.W, pady=3)
         
         # Separator
         ttk.Separator(adv_frame, orient=tk.HORIZONTAL).pack(fill=tk.X, pady=8)
         
         # Blank lines
-        ttk.Label(adv_frame, text="Blank Lines:", font=('Arial', 9, 'bold')).pack(anchor=tk.W, pady=(0,5))
-        
-        f3 = ttk.Frame(adv_frame)
-        f3.pack(fill=tk.X, pady=2)
-        ttk.Label(f3, text="After method:", width=14).pack(side=tk.LEFT)
-        v4 = tk.IntVar(value=1)
-        self.setting_vars['blank_lines_after_method'] = v4
-        ttk.Spinbox(f3, from_=0, to=3, textvariable=v4, width=5).pack(side=tk.LEFT, padx=2)
-        
-        f4 = ttk.Frame(adv_frame)
-        f4.pack(fill=tk.X, pady=2)
-        ttk.Label(f4, text="After class:", width=14).pack(side=tk.LEFT)
-        v5 = tk.IntVar(value=2)
-        self.setting_vars['blank_lines_after_class'] = v5
-        ttk.Spinbox(f4, from_=0, to=3, textvariable=v5, width=5).pack(side=tk.LEFT, padx=2)
+        ttk.Label(adv_frame, text="Blank Lines:", font=_FONT_HEADING).pack(anchor=tk.W, pady=(0,5))
+        for spec in _BLANK_LINE_FIELDS:
+            self._add_field(adv_frame, *spec, label_width=14, pady=2)
         
         # Custom lock notice
-        self.lock_label = ttk.Label(container, text="", font=('Arial', 8, 'italic'), 
+        self.lock_label = ttk.Label(container, text="", font=_FONT_HINT_ITALIC, 
                                     foreground='#e67e22')
         self.lock_label.pack(side=tk.BOTTOM, pady=(8,0))
     
+    def _add_field(self, parent, key, label, kind, default, options, unit, label_width, pady):
+        """Build one labelled setting row from a field spec and register its variable."""
+        row = ttk.Frame(parent)
+        row.pack(fill=tk.X, pady=pady)
+        ttk.Label(row, text=label, width=label_width).pack(side=tk.LEFT)
+        if kind == 'spin':
+            var = tk.IntVar(value=default)
+            ttk.Spinbox(row, from_=options[0], to=options[1], textvariable=var, width=6).pack(side=tk.LEFT, padx=3)
+        else:
+            var = tk.StringVar(value=default)
+            ttk.Combobox(row, textvariable=var, values=list(options),
+                         state='readonly', width=12).pack(side=tk.LEFT, padx=3)
+        if unit:
+            ttk.Label(row, text=unit, font=_FONT_HINT, foreground='gray').pack(side=tk.LEFT)
+        self.setting_vars[key] = var
+
     def set_scheme(self, scheme):
         """Enable/disable custom options based on scheme selection."""
-        if scheme == 'custom':
+        locked = scheme != 'custom'
+        if locked == self._applied_lock:
+            # e.g. black -> ruff: the widgets are already in the right state
+            return
+        self._applied_lock = locked
+        if not locked:
             self.custom_locked = False
             self.lock_label.config(text="")
             # Enable all widgets
-            for widget in self.winfo_children():
+            for widget in self.children.values():
                 self._enable_children(widget)
         else:
             self.custom_locked = True
             self.lock_label.config(text="ℹ Custom options locked - Select 'Custom' scheme to modify")
             # Disable all widgets except lock label
-            for widget in self.winfo_children():
+            for widget in self.children.values():
                 if widget != self.lock_label:
                     self._disable_children(widget)
     
     def _enable_children(self, widget):
-        try:
+        # .children is the Python-side registry; winfo_children() would ask Tcl
+        # for a fresh list at every level of the walk
+        if _has_state(widget):
             widget.configure(state='normal')
-        except:
-            pass
-        for child in widget.winfo_children():
+        for child in widget.children.values():
             self._enable_children(child)
     
     def _disable_children(self, widget):
-        try:
-            if not isinstance(widget, ttk.Label):
-                widget.configure(state='disabled')
-        except:
-            pass
-        for child in widget.winfo_children():
+        if not isinstance(widget, ttk.Label) and _has_state(widget):
+            widget.configure(state='disabled')
+        for child in widget.children.values():
             self._disable_children(child)
     
     def get_settings(self):
@@ -13,10 +13,15 @@ import sys
 import subprocess
 import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext
+import tkinter.font as tkfont
 import threading
 import os
+from collections import deque
 from pathlib import Path
 
+# Installation log is trimmed to this many lines so pip output cannot grow it unbounded
+_LOG_MAX_LINES = 500
+
 class DependencyInstallerGUI:
     """GUI for installing dependencies with progress tracking."""
     
@@ -32,6 +37,23 @@ class DependencyInstallerGUI:
         y = (self.root.winfo_screenheight() // 2) - (500 // 2)
         self.root.geometry(f"600x500+{x}+{y}")
         
+        # Named fonts: parsed once by Tk, referenced by name from each widget.
+        # Keep the Font objects alive; Tk drops a named font when it is collected.
+        self.fonts = [
+            tkfont.Font(self.root, name='LauncherTitle', family='Segoe UI', size=16, weight='bold'),
+            tkfont.Font(self.root, name='LauncherSubtitle', family='Segoe UI', size=10),
+            tkfont.Font(self.root, name='LauncherBody', family='Segoe UI', size=9),
+            tkfont.Font(self.root, name='LauncherMono', family='Consolas', size=9),
+        ]
+        
+        # The worker thread never touches Tk: it queues log lines and
+        # (callback, args) pairs that _pump runs on the Tk thread.
+        # _pump is only scheduled while there is something to drain.
+        self._log_buffer = deque()
+        self._ui_calls = deque()
+        self._pump_lock = threading.Lock()
+        self._pump_armed = False
+        
         self.setup_ui()
         
     def setup_ui(self):
@@ -43,14 +65,14 @@ class DependencyInstallerGUI:
         title_label = ttk.Label(
             header_frame, 
             text=" CodeSentinel Setup",
-            font=("Segoe UI", 16, "bold")
+            font='LauncherTitle'
         )
         title_label.pack()
         
         subtitle_label = ttk.Label(
             header_frame,
             text="Installing required dependencies...",
-            font=("Segoe UI", 10)
+            font='LauncherSubtitle'
         )
         subtitle_label.pack(pady=(5, 0))
         
@@ -67,7 +89,7 @@ class DependencyInstallerGUI:
         self.status_label = ttk.Label(
             progress_frame,
             text="Preparing to install dependencies...",
-            font=("Segoe UI", 9)
+            font='LauncherBody'
         )
         self.status_label.pack(pady=(0, 10))
         
@@ -79,7 +101,7 @@ class DependencyInstallerGUI:
             log_frame,
             height=15,
             width=70,
-            font=("Consolas", 9),
+            font='LauncherMono',
             bg="#f8f9fa",
             fg="#212529"
         )
@@ -113,15 +135,55 @@ class DependencyInstallerGUI:
         self.close_button.pack(side="right")
         
     def log_message(self, message):
-        """Add a message to the log."""
-        self.log_text.insert(tk.END, f"{message}\n")
-        self.log_text.see(tk.END)
-        self.root.update_idletasks()
+        """Add a message to the log (written by the Tk thread within 50 ms)."""
+        self._log_buffer.append(f"{message}\n")
+        self._arm_pump()
+        
+    def _post(self, callback, *args):
+        """Queue a Tk call for the Tk thread; safe to use from the worker."""
+        self._ui_calls.append((callback, args))
+        self._arm_pump()
+        
+    def _arm_pump(self):
+        """Schedule _pump unless it is already pending."""
+        # Callers append before arming, so a _pump that is about to stop
+        # either sees the new item or leaves the flag clear for us
+        with self._pump_lock:
+            if self._pump_armed:
+                return
+            self._pump_armed = True
+        self.root.after(50, self._pump)
+        
+    def _pump(self):
+        """Run queued Tk calls and write buffered log lines with one insert.
+
+        Re-arms only while more work has been queued, so an idle launcher
+        has no polling timer.
+        """
+        try:
+            # popleft is atomic, so the worker can keep appending meanwhile
+            while self._ui_calls:
+                callback, args = self._ui_calls.popleft()
+                callback(*args)
+            if self._log_buffer:
+                lines = []
+                while self._log_buffer:
+                    lines.append(self._log_buffer.popleft())
+                self.log_text.insert(tk.END, "".join(lines))
+                # 'end-1c' sits on the empty line after the last newline
+                excess = int(self.log_text.index('end-1c').split('.')[0]) - 1 - _LOG_MAX_LINES
+                if excess > 0:
+                    self.log_text.delete('1.0', f'{excess + 1}.0')
+                self.log_text.see(tk.END)
+        finally:
+            with self._pump_lock:
+                rearm = self._pump_armed = bool(self._ui_calls or self._log_buffer)
+            if rearm:
+                self.root.after(50, self._pump)
         
     def update_status(self, status):
-        """Update the status label."""
-        self.status_label.config(text=status)
-        self.root.update_idletasks()
+        """Update the status label; safe to call from the worker."""
+        self._post(lambda: self.status_label.config(text=status))
         
     def start_installation(self):
         """Start the dependency installation process."""
@@ -162,29 +224,29 @@ class DependencyInstallerGUI:
             if not missing_packages:
                 self.update_status("All dependencies already installed!")
                 self.log_message("\n All dependencies are available!")
-                self.installation_complete(success=True)
+                self._post(self.installation_complete, True)
                 return
             
             # Install missing packages
             self.update_status(f"Installing {len(missing_packages)} missing packages...")
             self.log_message(f"\n Installing {len(missing_packages)} packages: {', '.join(missing_packages)}")
             
-            for i, package in enumerate(missing_packages, 1):
-                self.update_status(f"Installing {package} ({i}/{len(missing_packages)})...")
-                self.log_message(f"\n Installing {package}...")
-                
-                # Run pip install
-                result = subprocess.run([
-                    sys.executable, "-m", "pip", "install", package
-                ], capture_output=True, text=True)
-                
-                if result.returncode == 0:
-                    self.log_message(f" {package} installed successfully")
-                else:
-                    self.log_message(f"❌ Failed to install {package}")
-                    self.log_message(f"Error: {result.stderr}")
-                    self.installation_complete(success=False)
-                    return
+            # One pip process resolves and installs every missing package together;
+            # its output is streamed into the log line by line as pip prints it
+            process = subprocess.Popen([
+                sys.executable, "-m", "pip", "install", *missing_packages
+            ], stdout=subprocess.PIPE, stderr=subprocess.STDOUT, stdin=subprocess.DEVNULL,
+                text=True, bufsize=1)
+            with process.stdout:
+                for line in process.stdout:
+                    self.log_message(f"   {line.rstrip()}")
+            
+            if process.wait() == 0:
+                self.log_message(f" Installed {', '.join(missing_packages)}")
+            else:
+                self.log_message(f"❌ Failed to install {', '.join(missing_packages)}")
+                self._post(self.installation_complete, False)
+                return
             
             self.update_status("Verifying installation...")
             self.log_message("\n🔍 Verifying installation...")
@@ -207,14 +269,14 @@ class DependencyInstallerGUI:
             if all_installed:
                 self.log_message("\n All dependencies installed and verified!")
                 self.update_status("Installation complete!")
-                self.installation_complete(success=True)
+                self._post(self.installation_complete, True)
             else:
                 self.log_message("\n❌ Some packages failed verification")
-                self.installation_complete(success=False)
+                self._post(self.installation_complete, False)
                 
         except Exception as e:
             self.log_message(f"\n Installation error: {e}")
-            self.installation_complete(success=False)
+            self._post(self.installation_complete, False)
     
     def installation_complete(self, success):
         """Handle installation completion."""
@@ -233,12 +295,6 @@ class DependencyInstallerGUI:
         """Skip installation and show next steps."""
         self.root.destroy()
         
-        # Show informational message about next steps
-        root = tk.Tk()
-        root.withdraw()  # Hide the root window
-        # Destroy the temporary root BEFORE launching the main wizard to avoid multiple Tk roots
-        root.destroy()
-        
         try:
             # Prefer the new modular wizard if available
             try:
@@ -297,11 +353,7 @@ def check_and_install_dependencies():
 
 def launch_wizard_directly():
     """Show next steps when dependencies are available."""
-    root = tk.Tk()
-    root.withdraw()  # Hide the root window
-    # Destroy the temporary root BEFORE launching the main wizard to avoid multiple Tk roots
-    root.destroy()
-    
+    # The wizard creates its own Tk root; no temporary root is needed here
     try:
         # Prefer the new modular wizard if available
         try:
@@ -17,6 +17,7 @@ additional steps (alerts, IDE integration, GitHub linking) later.
 from __future__ import annotations
 
 import os
+import shutil
 import subprocess
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
@@ -24,10 +25,22 @@ from pathlib import Path
 from typing import Optional
 
 from .utils.config import ConfigManager
+from .utils.display import display_available
 
 
 class ProjectSetupWizard:
+    # git executable resolved once per process; "" once looked up and not found
+    _git_path: Optional[str] = None
+
+    @classmethod
+    def _git_executable(cls) -> Optional[str]:
+        if cls._git_path is None:
+            cls._git_path = shutil.which("git") or ""
+        return cls._git_path or None
+
     def __init__(self):
+        if not display_available():
+            raise RuntimeError("No display available for the project setup wizard.")
         self.root = tk.Tk()
         self.root.title("CodeSentinel Project Setup")
         self.root.geometry("800x500")
@@ -39,6 +52,9 @@ class ProjectSetupWizard:
         y = (self.root.winfo_screenheight() // 2) - (500 // 2)
         self.root.geometry(f"800x500+{x}+{y}")
 
+        # Registered once; widgets refer to the style by name
+        ttk.Style(self.root).configure("SetupTitle.TLabel", font=("Segoe UI", 16, "bold"))
+
         self.project_dir = tk.StringVar(value=str(Path.cwd()))
         self.git_status = tk.StringVar(value="Unknown")
 
@@ -48,7 +64,7 @@ class ProjectSetupWizard:
     def _build_ui(self):
         header = ttk.Frame(self.root)
         header.pack(fill="x", padx=16, pady=16)
-        ttk.Label(header, text="CodeSentinel Project Setup Wizard", font=("Segoe UI", 16, "bold")).pack()
+        ttk.Label(header, text="CodeSentinel Project Setup Wizard", style="SetupTitle.TLabel").pack()
         ttk.Label(header, text="Guided configuration for a new or existing project.", foreground="gray").pack(pady=(4, 0))
 
         main = ttk.Frame(self.root)
@@ -94,8 +110,16 @@ class ProjectSetupWizard:
 
     def _init_git(self):
         path = Path(self.project_dir.get())
+        git = self._git_executable()
+        if git is None:
+            messagebox.showwarning("Git", "Git is not installed or not on PATH.")
+            return
         try:
-            result = subprocess.run(["git", "init"], cwd=str(path), capture_output=True, text=True)
+            # No stdin and no terminal prompts: git must never wait on the GUI's console
+            result = subprocess.run(
+                [git, "init"], cwd=str(path), capture_output=True, text=True,
+                stdin=subprocess.DEVNULL, env={**os.environ, "GIT_TERMINAL_PROMPT": "0"},
+            )
             if result.returncode == 0:
                 messagebox.showinfo("Git", "Repository initialized successfully.")
             else:
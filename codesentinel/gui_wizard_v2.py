@@ -21,27 +21,623 @@ captured as configuration for follow-up commands handled by the CLI.
 from __future__ import annotations
 
 import glob
+import hashlib
+import json
 import os
+import queue
+import re
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
 import shutil
+import subprocess
 import sys
+import time
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
+import tkinter.font as tkfont
 import webbrowser
 from pathlib import Path
-from typing import Dict, Any, List, Tuple, Callable
+from typing import Dict, Any, List, Optional, Sequence, Tuple, Callable
+
+try:
+    import winreg
+except ImportError:  # not Windows
+    winreg = None
 
 from .utils.config import ConfigManager
+from .utils.display import display_available
 from . import __version__ as CS_VERSION
 
 
+def _relative_path_display(path: Path, cwd_s: str, home_s: str) -> str:
+    """Return a short display form of ``path`` relative to cwd or home.
+
+    Plain prefix checks keep non-matching paths to two string compares
+    instead of two ``relative_to`` ValueError round-trips.
+    """
+    p = str(path)
+    # rstrip so a root cwd/home ('/', 'C:\') does not become a doubled separator
+    cwd_prefix = cwd_s.rstrip(os.sep) + os.sep
+    if p.startswith(cwd_prefix):
+        return "./" + p[len(cwd_prefix):]
+    home_prefix = home_s.rstrip(os.sep) + os.sep
+    if p.startswith(home_prefix):
+        return "~/" + p[len(home_prefix):]
+    return p if len(p) <= 50 else "..." + p[-47:]
+
+
+# Static step content, built once at import rather than on every step render
+_PYTHON_VERSION = "{}.{}.{}".format(*sys.version_info[:3])
+
+_GITHUB_MODES = (
+    ("initialize", " Initialize New Repository"),
+    ("clone", " Clone Existing Repository"),
+    ("connect", " Connect to Existing Remote"),
+)
+
+_COPILOT_BENEFITS_TEXT = "\n".join((
+    "🔍 AI-powered code review",
+    "🤖 Intelligent audit remediation",
+    " Context-aware code generation",
+    " Security-first automation",
+    " Smart analysis with remediation",
+    " Automated cleanup",
+))
+
+_COPILOT_NOTES_TEXT = "\n".join((
+    "• Extension installs via code command",
+    "• Instructions at .github/copilot-instructions.md",
+    "• GitHub Copilot from VS Code marketplace",
+))
+
+# Written to .github/copilot-instructions.md by the Copilot integration
+_COPILOT_INSTRUCTIONS = """# CodeSentinel AI Agent Instructions
+
+CodeSentinel is a security-first automated maintenance and monitoring system with SEAM Protection™:
+**Security, Efficiency, And Minimalism** (with Security taking absolute priority).
+
+## Architecture Overview
+
+The codebase follows a dual-architecture pattern:
+
+- **`codesentinel/`** - Core Python package with CLI interface (`codesentinel`, `codesentinel-setup`)
+- **`tools/codesentinel/`** - Comprehensive maintenance automation scripts
+- **`tools/config/`** - JSON configuration files for alerts, scheduling, and policies
+- **`tests/`** - Test suite using pytest with unittest fallback
+
+## Key Commands
+
+### Development Audit
+```bash
+# Run interactive audit
+codesentinel !!!!
+
+# Get agent-friendly context for remediation
+codesentinel !!!! --agent
+```
+
+### Maintenance Operations
+```bash
+# Daily maintenance workflow
+python tools/codesentinel/scheduler.py --schedule daily
+
+# Weekly maintenance (security, dependencies, performance)
+python tools/codesentinel/scheduler.py --schedule weekly
+```
+
+## Core Principles
+
+### SECURITY
+- No hardcoded credentials - Environment variables or config files only
+- Audit logging - All operations logged with timestamps
+- Configuration validation - Auto-creation of missing configs with secure defaults
+- Dependency scanning - Automated vulnerability detection
+
+### EFFICIENCY
+- Avoid redundant code and duplicate implementations
+- Consolidate multiple versions of similar functionality
+- Clean up orphaned test files and unused scripts
+- Optimize import structures and module organization
+
+### MINIMALISM
+- Remove unnecessary dependencies
+- Archive deprecated code to quarantine_legacy_archive/
+- Maintain single source of truth for each feature
+- Keep codebase focused and maintainable
+
+## Persistent Policies
+
+When working with this codebase:
+
+1. **NON-DESTRUCTIVE**: Never delete code without archiving first
+2. **FEATURE PRESERVATION**: All existing functionality must be maintained
+3. **STYLE PRESERVATION**: Respect existing code style and patterns
+4. **SECURITY FIRST**: Security concerns always take priority
+
+## Agent-Driven Remediation
+
+When `codesentinel !!!! --agent` is run, you will receive comprehensive audit context with:
+
+- Detected issues (security, efficiency, minimalism)
+- Remediation hints with priority levels
+- Safe-to-automate vs. requires-review flags
+- Step-by-step suggested actions
+
+Your role is to:
+
+1. **ANALYZE**: Review each issue with full context
+2. **PRIORITIZE**: Focus on critical/high priority items first  
+3. **DECIDE**: Determine safe vs. requires-review actions
+4. **PLAN**: Build step-by-step remediation plan
+5. **EXECUTE**: Only perform safe, non-destructive operations
+6. **REPORT**: Document all actions and decisions
+
+## Safe Actions (can automate)
+
+- Moving test files to proper directories
+- Adding entries to .gitignore
+- Removing __pycache__ directories
+- Archiving confirmed-redundant files to quarantine_legacy_archive/
+
+## Requires Review (agent decision needed)
+
+- Deleting or archiving potentially-used code
+- Consolidating multiple implementations
+- Removing packaging configurations
+- Modifying imports or entry points
+
+## Forbidden Actions
+
+- Deleting files without archiving
+- Forcing code style changes
+- Removing features without verification
+- Modifying core functionality without explicit approval
+
+## Integration Points
+
+### GitHub Integration
+- Repository-aware configuration detection
+- Copilot instructions generation (this file)
+- PR review automation capabilities
+
+### Multi-Platform Support  
+- Python 3.13/3.14 requirement with backward compatibility
+- Cross-platform paths using `pathlib.Path` consistently
+- PowerShell/Python dual execution support for Windows/Unix
+
+## When Modifying This Codebase
+
+1. **Understand the dual architecture** - Core package vs. tools scripts serve different purposes
+2. **Maintain execution order** - Change detection dependency is critical
+3. **Preserve configuration structure** - JSON configs have specific schemas
+4. **Test both execution paths** - pytest and unittest must both work
+5. **Follow security-first principle** - Never compromise security for convenience
+6. **Update timeout values carefully** - Task timeouts affect workflow reliability
+"""
+
+# Optional-feature complexity badge -> WizardApp.colors key
+_COMPLEXITY_COLOR_KEYS = {
+    'Beginner': 'success',
+    'Intermediate': 'warning',
+    'Advanced': 'error',
+}
+
+# Seconds a GitHub validation result is reused for the same URL and token
+_GITHUB_PROBE_TTL = 60.0
+
+# https://github.com/<owner>/<repo>[.git][/] or git@github.com:<owner>/<repo>[.git]
+_GITHUB_REPO_RE = re.compile(
+    r'^(?:https?://(?:www\.)?github\.com/|git@github\.com:)([\w.-]+)/([\w.-]+?)(?:\.git)?/?$',
+    re.IGNORECASE,
+)
+
+
+def _parse_github_repo(url: str) -> Optional[Tuple[str, str]]:
+    """Return ``(owner, repo)`` for a GitHub repository URL, or None if malformed."""
+    match = _GITHUB_REPO_RE.match(url)
+    return (match.group(1), match.group(2)) if match else None
+
+
+@lru_cache(maxsize=None)
+def _which(cmd: str) -> Optional[str]:
+    """PATH lookup memoised for the life of the wizard (PATH does not change)."""
+    return shutil.which(cmd)
+
+
+# Recipients are separated by commas or semicolons; spaces belong to display names
+_RECIPIENT_SEP_RE = re.compile(r'[,;]')
+
+
+def _parse_recipients(text: str) -> List[str]:
+    """Extract addresses from the recipients field, dropping repeats (order kept)."""
+    parts = (part.strip() for part in _RECIPIENT_SEP_RE.split(text))
+    return list(dict.fromkeys(part for part in parts if part))
+
+
+# Installed-IDE scan results are reused across wizard runs for this long (seconds).
+# Per user: %APPDATA%\CodeSentinel on Windows, ~/.codesentinel elsewhere.
+_IDE_CACHE_PATH = (Path(os.environ['APPDATA']) / "CodeSentinel" if os.environ.get('APPDATA')
+                   else Path.home() / ".codesentinel") / "ide_cache.json"
+_IDE_CACHE_TTL = 3600.0
+
+# Install roots, read once from the environment so relocated profiles and
+# Program Files folders are found (USERNAME need not match the profile dir)
+_LOCAL_APPDATA = os.environ.get('LOCALAPPDATA') or os.path.join(os.path.expanduser('~'), 'AppData', 'Local')
+_PROGRAM_FILES = os.environ.get('ProgramFiles', 'C:\\Program Files')
+_PROGRAM_FILES_X86 = os.environ.get('ProgramFiles(x86)', 'C:\\Program Files (x86)')
+
+# IDEs offered on the IDE step: uninstall-entry DisplayName prefixes, PATH
+# commands and install-path patterns used for detection, plus the display
+# text and download link
+_IDE_CONFIGS: Tuple[Dict[str, Any], ...] = (
+    {
+        'name': 'Visual Studio Code',
+        'key': 'VS Code',
+        'description': 'Lightweight, extensible code editor',
+        'display_names': ('Microsoft Visual Studio Code',),
+        'commands': ['code'],
+        'paths': [
+            f'{_LOCAL_APPDATA}\\Programs\\Microsoft VS Code\\Code.exe',
+            f'{_PROGRAM_FILES}\\Microsoft VS Code\\Code.exe',
+            f'{_PROGRAM_FILES_X86}\\Microsoft VS Code\\Code.exe'
+        ],
+        'icon': '',
+        'url': 'https://code.visualstudio.com/'
+    },
+    {
+        'name': 'Visual Studio',
+        'key': 'Visual Studio',
+        'description': 'Full-featured IDE for .NET and C++',
+        'display_names': ('Visual Studio Community', 'Visual Studio Professional', 'Visual Studio Enterprise'),
+        'commands': ['devenv'],
+        'paths': [
+            f'{_PROGRAM_FILES}\\Microsoft Visual Studio\\2022\\*\\Common7\\IDE\\devenv.exe',
+            f'{_PROGRAM_FILES_X86}\\Microsoft Visual Studio\\2019\\*\\Common7\\IDE\\devenv.exe',
+            f'{_PROGRAM_FILES_X86}\\Microsoft Visual Studio\\2017\\*\\Common7\\IDE\\devenv.exe'
+        ],
+        'icon': '',
+        'url': 'https://visualstudio.microsoft.com/'
+    },
+    {
+        'name': 'PyCharm',
+        'key': 'PyCharm',
+        'description': 'Python-focused IDE by JetBrains',
+        'display_names': ('PyCharm',),
+        'commands': ['pycharm64', 'charm', 'pycharm'],
+        'paths': [
+            f'{_LOCAL_APPDATA}\\JetBrains\\Toolbox\\apps\\PyCharm-P\\*\\bin\\pycharm64.exe',
+            f'{_PROGRAM_FILES}\\JetBrains\\PyCharm*\\bin\\pycharm64.exe',
+            f'{_LOCAL_APPDATA}\\JetBrains\\PyCharm*\\bin\\pycharm64.exe',
+            f'{_PROGRAM_FILES}\\JetBrains\\PyCharm*\\bin\\pycharm.exe'
+        ],
+        'icon': '',
+        'url': 'https://www.jetbrains.com/pycharm/'
+    },
+    {
+        'name': 'IntelliJ IDEA',
+        'key': 'IntelliJ IDEA',
+        'description': 'Java IDE with multi-language support',
+        'display_names': ('IntelliJ IDEA',),
+        'commands': ['idea64', 'idea'],
+        'paths': [
+            f'{_LOCAL_APPDATA}\\JetBrains\\Toolbox\\apps\\IDEA-U\\*\\bin\\idea64.exe',
+            f'{_PROGRAM_FILES}\\JetBrains\\IntelliJ IDEA*\\bin\\idea64.exe'
+        ],
+        'icon': '',
+        'url': 'https://www.jetbrains.com/idea/'
+    },
+    {
+        'name': 'RStudio',
+        'key': 'RStudio',
+        'description': 'IDE for R statistical computing and graphics',
+        'display_names': ('RStudio',),
+        'commands': ['rstudio'],
+        'paths': [
+            f'{_PROGRAM_FILES}\\RStudio\\rstudio.exe',
+            f'{_PROGRAM_FILES}\\RStudio\\bin\\rstudio.exe',
+            f'{_LOCAL_APPDATA}\\RStudio\\rstudio.exe'
+        ],
+        'icon': '',
+        'url': 'https://posit.co/download/rstudio-desktop/'
+    },
+    {
+        'name': 'Sublime Text',
+        'key': 'Sublime Text',
+        'description': 'Fast, lightweight text editor',
+        'display_names': ('Sublime Text',),
+        'commands': ['sublime_text', 'subl'],
+        'paths': [
+            f'{_PROGRAM_FILES}\\Sublime Text*\\sublime_text.exe',
+            f'{_LOCAL_APPDATA}\\Sublime Text*\\sublime_text.exe'
+        ],
+        'icon': '📄',
+        'url': 'https://www.sublimetext.com/'
+    },
+    {
+        'name': 'Atom',
+        'key': 'Atom',
+        'description': 'Hackable text editor (deprecated)',
+        'commands': ['atom'],
+        'paths': [
+            f'{_LOCAL_APPDATA}\\atom\\atom.exe'
+        ],
+        'icon': '',
+        'url': 'https://atom.io/'
+    },
+    {
+        'name': 'Notepad++',
+        'key': 'Notepad++',
+        'description': 'Enhanced notepad with syntax highlighting',
+        'display_names': ('Notepad++',),
+        'commands': ['notepad++'],
+        'paths': [
+            f'{_PROGRAM_FILES}\\Notepad++\\notepad++.exe',
+            f'{_PROGRAM_FILES_X86}\\Notepad++\\notepad++.exe'
+        ],
+        'icon': '',
+        'url': 'https://notepad-plus-plus.org/'
+    },
+    {
+        'name': 'Eclipse',
+        'key': 'Eclipse',
+        'description': 'Java development environment',
+        'commands': ['eclipse'],
+        'paths': [
+            'C:\\eclipse\\eclipse.exe',
+            f'{_PROGRAM_FILES}\\Eclipse\\*\\eclipse.exe'
+        ],
+        'icon': '',
+        'url': 'https://www.eclipse.org/'
+    }
+)
+
+
+@lru_cache(maxsize=None)
+def _split_wildcard(pattern: str) -> Optional[Tuple[str, str, str]]:
+    """Split ``parent/prefix*/rest`` into its three parts, once per pattern.
+
+    Returns None unless the pattern has exactly one ``*``, at the end of a
+    path component; those patterns still go through glob.
+    """
+    star = pattern.find('*')
+    if star < 0 or pattern.count('*') > 1:
+        return None
+    sep = max(pattern.rfind('\\', 0, star), pattern.rfind('/', 0, star))
+    if sep < 0 or star + 1 >= len(pattern) or pattern[star + 1] not in '\\/':
+        return None
+    return pattern[:sep], pattern[sep + 1:star], pattern[star + 2:]
+
+
+def _entry_names(parent: str) -> Tuple[str, ...]:
+    """Names in one directory (raises OSError if it cannot be listed)."""
+    with os.scandir(parent) as entries:
+        return tuple(entry.name for entry in entries)
+
+
+def _path_matches(pattern: str, names: Optional[Tuple[str, ...]] = None) -> bool:
+    """True if an install-path pattern matches something on disk.
+
+    Literal paths cost a single stat. ``parent/prefix*/rest`` patterns test
+    ``rest`` only under entries of ``parent`` starting with ``prefix``; no
+    regex translation and no stat of unrelated siblings. ``names`` is a
+    listing of ``parent`` taken earlier, reused instead of scanning again.
+    """
+    if '*' not in pattern:
+        return os.path.exists(pattern)
+    parts = _split_wildcard(pattern)
+    if parts is None:
+        return bool(glob.glob(pattern))
+    parent, prefix, rest = parts
+    if names is None:
+        try:
+            names = _entry_names(parent)
+        except OSError:
+            return False
+    prefix = os.path.normcase(prefix)
+    return any(os.path.normcase(name).startswith(prefix)
+               and os.path.exists(os.path.join(parent, name, rest))
+               for name in names)
+
+
+def _pattern_root(pattern: str) -> str:
+    """Deepest literal directory of an install-path pattern ('' if none)."""
+    star = pattern.find('*')
+    head = pattern if star < 0 else pattern[:star]
+    sep = max(head.rfind('\\'), head.rfind('/'))
+    return head[:sep] if sep > 0 else ''
+
+
+def _probe_root(root: str, listed: bool) -> Tuple[bool, Optional[Tuple[str, ...]]]:
+    """Whether an install root exists, plus its entry names if ``listed``."""
+    if not listed:
+        return os.path.isdir(root), None
+    try:
+        return True, _entry_names(root)
+    except OSError:
+        return False, None
+
+
+_UNINSTALL_KEY = 'SOFTWARE\\Microsoft\\Windows\\CurrentVersion\\Uninstall'
+
+
+def _registry_display_names() -> Tuple[str, ...]:
+    """DisplayName of every program in the Windows uninstall keys (empty off Windows).
+
+    One walk of the machine, 32-bit and per-user keys answers most IDEs
+    without touching Program Files.
+    """
+    if winreg is None:
+        return ()
+    names = []
+    for hive, path in ((winreg.HKEY_LOCAL_MACHINE, _UNINSTALL_KEY),
+                       (winreg.HKEY_LOCAL_MACHINE, _UNINSTALL_KEY.replace('SOFTWARE', 'SOFTWARE\\WOW6432Node', 1)),
+                       (winreg.HKEY_CURRENT_USER, _UNINSTALL_KEY)):
+        try:
+            with winreg.OpenKey(hive, path) as key:
+                for index in range(winreg.QueryInfoKey(key)[0]):
+                    try:
+                        with winreg.OpenKey(key, winreg.EnumKey(key, index)) as entry:
+                            name = winreg.QueryValueEx(entry, 'DisplayName')[0]
+                    except OSError:
+                        continue
+                    if isinstance(name, str):
+                        names.append(name)
+        except OSError:
+            continue
+    return tuple(names)
+
+
+def _ide_installed(config: Dict[str, Any],
+                   live_roots: Optional[Dict[str, Optional[Tuple[str, ...]]]] = None) -> bool:
+    """Check one IDE: PATH commands first, then its known install paths.
+
+    When ``live_roots`` is given (root -> listing or None), patterns whose
+    root directory is not in it are skipped without touching the disk, and
+    wildcard patterns match against the root's stored listing.
+    """
+    if any(_which(cmd) for cmd in config['commands']):
+        return True
+    for pattern in config.get('paths', ()):
+        names = None
+        if live_roots is not None:
+            root = _pattern_root(pattern)
+            if root:
+                if root not in live_roots:
+                    continue
+                names = live_roots[root]
+        try:
+            if _path_matches(pattern, names):
+                return True
+        except Exception:
+            continue
+    return False
+
+
+def _detect_ides(ide_configs: Sequence[Dict[str, Any]]) -> Dict[str, bool]:
+    """Scan for installed IDEs, one worker per IDE so directory lookups overlap.
+
+    Each distinct root directory is checked once up front, so every pattern
+    under a missing vendor folder is dropped for the cost of one stat. Roots
+    that wildcard patterns enumerate (e.g. JetBrains, with PyCharm* and
+    IntelliJ IDEA* below it) are listed once and shared by all of them.
+    IDEs already listed in the Windows uninstall registry skip the disk.
+    """
+    registered = _registry_display_names()
+    found = {
+        config['key']: any(name.startswith(config.get('display_names', ())) for name in registered)
+        for config in ide_configs
+    }
+    pending = [config for config in ide_configs if not found[config['key']]]
+    if not pending:
+        return found
+    patterns = [pattern for config in pending for pattern in config.get('paths', ())]
+    listed = {_split_wildcard(pattern)[0] for pattern in patterns if _split_wildcard(pattern)}
+    roots = list({_pattern_root(pattern) for pattern in patterns} - {''})
+    with ThreadPoolExecutor(max_workers=len(pending), thread_name_prefix="ide-scan") as pool:
+        probes = pool.map(lambda root: _probe_root(root, root in listed), roots)
+        live_roots = {root: names for root, (live, names) in zip(roots, probes) if live}
+        hits = pool.map(lambda config: _ide_installed(config, live_roots), pending)
+        found.update(zip((config['key'] for config in pending), hits))
+    return found
+
+
+def _ide_cache_fingerprint(ide_configs: Sequence[Dict[str, Any]]) -> str:
+    """Digest of what a scan depends on: the IDE table, PATH and install-root mtimes.
+
+    Installing or removing an IDE creates, deletes or touches its install
+    root, so the cache is dropped before the TTL runs out. One stat per root.
+    """
+    roots = sorted({_pattern_root(pattern) for config in ide_configs
+                    for pattern in config['paths']} - {''})
+    stamps = {}
+    for root in roots:
+        try:
+            stamps[root] = os.stat(root).st_mtime_ns
+        except OSError:
+            stamps[root] = None
+    payload = json.dumps([list(ide_configs), os.environ.get('PATH', ''), stamps], sort_keys=True)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def _load_ide_cache(keys: List[str], fingerprint: str) -> Optional[Dict[str, bool]]:
+    """Return cached IDE scan results if fresh, taken under ``fingerprint`` and covering exactly ``keys``."""
+    try:
+        if time.time() - _IDE_CACHE_PATH.stat().st_mtime > _IDE_CACHE_TTL:
+            return None
+        with open(_IDE_CACHE_PATH, encoding='utf-8') as fh:
+            cached = json.load(fh)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(cached, dict) or cached.get('fingerprint') != fingerprint:
+        return None
+    statuses = cached.get('statuses')
+    if not isinstance(statuses, dict) or set(statuses) != set(keys):
+        return None
+    return {key: bool(found) for key, found in statuses.items()}
+
+
+def _save_ide_cache(statuses: Dict[str, bool], fingerprint: str):
+    """Persist IDE scan results with the fingerprint they were taken under; best effort."""
+    try:
+        _IDE_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        with open(_IDE_CACHE_PATH, 'w', encoding='utf-8') as fh:
+            json.dump({'fingerprint': fingerprint, 'statuses': statuses}, fh)
+    except OSError:
+        pass
+
+
+def _scan_ides() -> Dict[str, bool]:
+    """Installed-IDE status per key: a recent cached scan, else a fresh one."""
+    # Taken before scanning, so an install that lands mid-scan invalidates the result
+    fingerprint = _ide_cache_fingerprint(_IDE_CONFIGS)
+    statuses = _load_ide_cache([config['key'] for config in _IDE_CONFIGS], fingerprint)
+    if statuses is None:
+        statuses = _detect_ides(_IDE_CONFIGS)
+        _save_ide_cache(statuses, fingerprint)
+    return statuses
+
+
+def _ide_enabled(entry: Any) -> bool:
+    """True if an IDE step entry is selected.
+
+    Entries are ``{'detected': ..., 'enabled': ...}`` dicts; older configs stored a bare bool.
+    """
+    if isinstance(entry, dict):
+        return bool(entry.get('enabled', False))
+    return bool(entry)
+
+
+def _run_git(*args: str, cwd: Optional[Path] = None, timeout: float = 30,
+             capture: bool = True) -> subprocess.CompletedProcess:
+    """Run ``git <args>`` non-interactively: no stdin, no credential prompts, bounded time.
+
+    With ``capture=False`` output goes to the null device instead of pipes
+    that would only be read and thrown away.
+    """
+    sink = subprocess.PIPE if capture else subprocess.DEVNULL
+    return subprocess.run(
+        ["git", *args],
+        cwd=str(cwd) if cwd is not None else None,
+        stdout=sink,
+        stderr=sink,
+        text=True,
+        timeout=timeout,
+        stdin=subprocess.DEVNULL,
+        env={**os.environ, "GIT_TERMINAL_PROMPT": "0"},
+    )
+
+
 class ScrollableFrame(ttk.Frame):
     """Scrollable frame with optional content centering."""
     def __init__(self, master, center_content=False, max_width=700, *args, **kwargs):
         super().__init__(master, *args, **kwargs)
         self.center_content = center_content
         self.max_width = max_width
+        self._scroll_pending = False
         
         canvas = tk.Canvas(self, borderwidth=0, highlightthickness=0, bg='white')
+        self._canvas = canvas
         vsb = ttk.Scrollbar(self, orient="vertical", command=canvas.yview)
         
         if center_content:
@@ -56,42 +652,71 @@ class ScrollableFrame(ttk.Frame):
                 canvas_width = canvas.winfo_width()
                 x_position = max(0, (canvas_width - max_width) // 2)
                 canvas.coords(canvas.find_withtag("all")[0], x_position, 0)
-                canvas.configure(scrollregion=canvas.bbox("all"))
+                self._schedule_scrollregion()
             
             canvas.bind("<Configure>", _on_configure)
-            container.bind("<Configure>", lambda e: canvas.configure(scrollregion=canvas.bbox("all")))
+            container.bind("<Configure>", self._schedule_scrollregion)
         else:
             # Standard layout
             self.inner = ttk.Frame(canvas)
-            self.inner.bind("<Configure>", lambda e: canvas.configure(scrollregion=canvas.bbox("all")))
+            self.inner.bind("<Configure>", self._schedule_scrollregion)
             canvas.create_window((0, 0), window=self.inner, anchor="nw")
         
         canvas.configure(yscrollcommand=vsb.set)
         canvas.pack(side="left", fill="both", expand=True)
         vsb.pack(side="right", fill="y")
         
-        # Mouse wheel scrolling
-        def _on_mousewheel(event):
-            canvas.yview_scroll(int(-1*(event.delta/120)), "units")
-        canvas.bind_all("<MouseWheel>", _on_mousewheel)
+        # Mouse wheel scrolling: one shared handler per window that scrolls the
+        # innermost ScrollableFrame under the pointer, so nested or repeated
+        # instances don't each install (and overwrite) a global binding
+        toplevel = self.winfo_toplevel()
+        if not getattr(toplevel, '_cs_wheel_bound', False):
+            canvas.bind_all("<MouseWheel>", ScrollableFrame._route_mousewheel)
+            toplevel._cs_wheel_bound = True
+
+    @staticmethod
+    def _route_mousewheel(event):
+        widget = event.widget
+        while widget is not None and not isinstance(widget, ScrollableFrame):
+            widget = getattr(widget, 'master', None)
+        if widget is not None:
+            widget._canvas.yview_scroll(int(-1*(event.delta/120)), "units")
+
+    def _schedule_scrollregion(self, event=None):
+        """Coalesce a burst of <Configure> events into one idle-time update."""
+        if not self._scroll_pending:
+            self._scroll_pending = True
+            self.after_idle(self._update_scrollregion)
+
+    def _update_scrollregion(self):
+        self._scroll_pending = False
+        if self._canvas.winfo_exists():
+            self._canvas.configure(scrollregion=self._canvas.bbox("all"))
 
 
 class WizardApp:
     WIDTH, HEIGHT = 900, 750
 
     def __init__(self):
+        # Fail fast when headless: tk.Tk() would otherwise stall on the X connect
+        if not display_available():
+            raise RuntimeError("No display available; run 'codesentinel setup --non-interactive' instead.")
         self.root = tk.Tk()
         # Window title shows product name and version only
         self.root.title(f"CodeSentinel Setup Wizard v{CS_VERSION}")
         self.root.geometry(f"{self.WIDTH}x{self.HEIGHT}")
         self.root.resizable(True, True)
         self._center()
+        self._register_fonts()
 
         # Style configuration (legacy-inspired)
         self.style = ttk.Style()
-        self.style.configure('Title.TLabel', font=('Arial', 16, 'bold'))
-        self.style.configure('Step.TLabel', font=('Arial', 12, 'bold'))
-        self.style.configure('Section.TLabel', font=('Arial', 11, 'bold'))
+        self.style.configure('Title.TLabel', font='WizardTitle')
+        self.style.configure('Step.TLabel', font='WizardStep')
+        self.style.configure('Section.TLabel', font='WizardSection')
+        # Gray step intros and small hints: one style lookup instead of per-widget options
+        self.style.configure('Intro.TLabel', font='WizardBody', foreground='gray')
+        self.style.configure('Hint.TLabel', font='WizardSmall', foreground='gray')
         
         # Color scheme for status indicators
         self.colors = {
@@ -103,8 +728,12 @@ class WizardApp:
             'disabled': '#9e9e9e'  # gray
         }
 
+        # Resolved once: every step reads the launch directory and its git state
+        self._cwd = Path.cwd()
+        self._cwd_is_git = (self._cwd / ".git").exists()
+
         self.data: Dict[str, Any] = {
-            "install_location": str(Path.cwd()),
+            "install_location": str(self._cwd),
             "alerts": {
                 "console": {"enabled": True},
                 "file": {"enabled": True, "log_file": "codesentinel.log"},
@@ -124,13 +753,63 @@ class WizardApp:
             'github': False
         }
 
-        self.steps: List[Tuple[str, Callable[[], ttk.Frame]]] = []
+        # Network validation probes run here so the Tk thread never blocks
+        self._io_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="wizard-io")
+        # Worker threads never touch Tk: they queue (callback, args) for the Tk thread
+        self._ui_queue: "queue.Queue[Tuple[Callable[..., Any], tuple]]" = queue.Queue()
+        # Pool jobs whose callback has not run yet; the queue is polled only while > 0
+        self._io_jobs = 0
+        self._ui_pump_armed = False
+        # The IDE scan starts now, one job for the whole run, so the IDE step
+        # usually finds it finished; the step fills its rows when it lands
+        self._ide_scan: Future = self._io_pool.submit(_scan_ides)
+        # Set once the IDE rows are drawn; Next stays disabled on that step until then
+        self._ide_rows_ready = False
+        self.ide_vars: Dict[str, tk.BooleanVar] = {}
+        # (api_url, token) -> (monotonic timestamp, probe result)
+        self._github_probe_cache: Dict[Tuple[str, str], Tuple[float, Tuple[str, str, bool]]] = {}
+        # validation key -> inputs of the probe currently running for it
+        self._probes_in_flight: Dict[str, Tuple[Any, ...]] = {}
+
+        # (title, builder, reusable); reusable frames are kept and re-packed on revisit
+        self.steps: Tuple[Tuple[str, Callable[[], ttk.Frame], bool], ...] = ()
+        self._step_frames: Dict[int, ttk.Frame] = {}
         self._active_frame: ttk.Frame | None = None
+        # Set while a coalesced _update_nav_state is queued for idle time
+        self._nav_pending = False
+        # Toggles read by the navigation lock; created by their steps on first build
+        self.github_enabled_var: Optional[tk.BooleanVar] = None
+        self.email_var: Optional[tk.BooleanVar] = None
+        self.slack_var: Optional[tk.BooleanVar] = None
+        # Footer thumbnail, decoded lazily by _polymath_thumbnail
+        self._polymath_img: Optional[tk.PhotoImage] = None
+        self._polymath_loaded = False
         self._build_ui()
         self._build_steps()
         self._show_step(0)
 
     # ---- window layout ----
+    def _register_fonts(self):
+        """Register the named fonts shared by every wizard widget.
+
+        Tk resolves a named font once; tuple specs are re-parsed per widget.
+        """
+        specs = {
+            'WizardTitle': {'family': 'Arial', 'size': 16, 'weight': 'bold'},
+            'WizardStep': {'family': 'Arial', 'size': 12, 'weight': 'bold'},
+            'WizardSection': {'family': 'Arial', 'size': 11, 'weight': 'bold'},
+            'WizardBody': {'family': 'Arial', 'size': 9},
+            'WizardBodyBold': {'family': 'Arial', 'size': 9, 'weight': 'bold'},
+            'WizardBodyItalic': {'family': 'Arial', 'size': 9, 'slant': 'italic'},
+            'WizardSmall': {'family': 'Arial', 'size': 8},
+            'WizardSmallItalic': {'family': 'Arial', 'size': 8, 'slant': 'italic'},
+            'WizardTiny': {'family': 'Arial', 'size': 7},
+            'WizardMono': {'family': 'Courier New', 'size': 8},
+            'WizardCode': {'family': 'Consolas', 'size': 9},
+        }
+        # Keep references: Tk deletes a named font when its Font object is collected
+        self.fonts = {name: tkfont.Font(self.root, name=name, **opts) for name, opts in specs.items()}
+
     def _center(self):
         self.root.update_idletasks()
         x = (self.root.winfo_screenwidth() // 2) - (self.WIDTH // 2)
@@ -142,12 +821,12 @@ class WizardApp:
         self.header = ttk.Frame(self.root)
         self.header.pack(fill="x", padx=20, pady=(16, 8))
         ttk.Label(self.header, text="CodeSentinel Setup Wizard", style='Title.TLabel').pack()
-        ttk.Label(self.header, text="SEAM Protected™", font=('Arial', 9), foreground=self.colors['info']).pack(pady=(2, 0))
+        ttk.Label(self.header, text="SEAM Protected™", font='WizardBody', foreground=self.colors['info']).pack(pady=(2, 0))
         # Subtle attribution and version line
         ttk.Label(
             self.header,
             text=f"by Polymath • v{CS_VERSION}",
-            font=('Arial', 8),
+            font='WizardSmall',
             foreground='#666666'
         ).pack(pady=(2, 0))
         
@@ -159,12 +838,15 @@ class WizardApp:
         self.progress_bar.pack(fill="x")
         
         # Step indicator
-        self.step_label = ttk.Label(self.root, text="", style='Step.TLabel')
+        self.step_label_var = tk.StringVar()
+        self.step_label = ttk.Label(self.root, textvariable=self.step_label_var, style='Step.TLabel')
         self.step_label.pack(padx=20, pady=(8, 12))
 
         # Body (scrollable content area)
         self.body = ttk.Frame(self.root)
         self.body.pack(fill="both", expand=True, padx=20, pady=(0, 12))
+        # Step title shown above every step but Welcome; text swapped per step
+        self.section_label = ttk.Label(self.body, style='Section.TLabel', foreground=self.colors['info'])
 
         # Footer with navigation
         self.footer = ttk.Frame(self.root)
@@ -187,30 +869,94 @@ class WizardApp:
         self.bottom_brand = ttk.Label(
             self.bottom_margin,
             text="",
-            font=('Arial', 7),
+            font='WizardTiny',
             foreground='#999999'
         )
         self.bottom_brand.pack(anchor="center")
 
-    def _clear_body(self):
-        for w in self.body.winfo_children():
-            w.destroy()
+    def _polymath_thumbnail(self) -> Optional[tk.PhotoImage]:
+        """Load and scale the footer thumbnail on first use; later visits reuse it."""
+        if self._polymath_loaded:
+            return self._polymath_img
+        self._polymath_loaded = True
+        try:
+            _here = Path(__file__).resolve().parent
+            candidate_paths = [
+                _here / "assets" / "polymath.png",
+                _here.parent / "docs" / "polymath.png",
+            ]
+            for _p in candidate_paths:
+                if _p.exists():
+                    full_img = tk.PhotoImage(file=str(_p))
+                    target_w, target_h = 50, 40
+                    # Determine scaling factor to keep aspect ratio within target bounds
+                    width_factor = max(1, (full_img.width() + target_w - 1) // target_w)
+                    height_factor = max(1, (full_img.height() + target_h - 1) // target_h)
+                    scale = max(width_factor, height_factor)
+                    self._polymath_img = full_img.subsample(scale, scale)  # type: ignore
+                    break
+        except Exception:
+            # Image optional; proceed without it
+            self._polymath_img = None
+        return self._polymath_img
+
+    @staticmethod
+    def _section(parent: tk.Misc, title: str, padding: int = 10, **pack_opts) -> ttk.LabelFrame:
+        """Create and pack a titled LabelFrame section; returns it for children."""
+        frame = ttk.LabelFrame(parent, text=title, padding=padding)
+        frame.pack(**pack_opts)
+        return frame
+
+    def _destroy_widgets(self, *widgets: tk.Misc):
+        """Tear down widgets and their subtrees with a single Tcl ``destroy`` call."""
+        if not widgets:
+            return
+        self.root.tk.call('destroy', *map(str, widgets))
+        # Tcl has already removed the windows; release the Python-side wrappers
+        # and any callbacks they registered.
+        stack = list(widgets)
+        while stack:
+            w = stack.pop()
+            stack.extend(w.children.values())
+            tk.Misc.destroy(w)
+            w.children.clear()
+        for widget in widgets:
+            widget.master.children.pop(widget._name, None)
+
+    def _leave_step(self):
+        """Hide a reusable step frame, destroy any other."""
+        frame = self._active_frame
+        if frame is None:
+            return
+        if self._step_frames.get(self.current) is frame:
+            frame.pack_forget()
+        else:
+            self._destroy_widgets(frame)
+        self._active_frame = None
 
     def _show_step(self, idx: int):
+        self._leave_step()
         self.current = idx
-        self._clear_body()
-        title, builder = self.steps[idx]
+        title, builder, reusable = self.steps[idx]
         
         # Update progress indicators
         self.progress_var.set(idx + 1)
-        self.step_label.config(text=f"Step {idx + 1} of {len(self.steps)}: {title}")
+        self.step_label_var.set(f"Step {idx + 1} of {len(self.steps)}: {title}")
         
         # Build step content - skip adding title label for Welcome page
         if idx != 0:  # Don't add extra title for Welcome page
-            ttk.Label(self.body, text=title, style='Section.TLabel', foreground=self.colors['info']).pack(anchor="w", pady=(0, 12))
+            self.section_label.config(text=title)
+            self.section_label.pack(anchor="w", pady=(0, 12))
+        else:
+            self.section_label.pack_forget()
         
-        self._active_frame = builder()
-        self._active_frame.pack(fill="both", expand=True)
+        frame = self._step_frames.get(idx)
+        if frame is None:
+            frame = builder()
+            if reusable:
+                self._step_frames[idx] = frame
+        self._active_frame = frame
+        frame.pack(fill="both", expand=True)
         
         # Update navigation buttons
         self.back_btn.state(["!disabled"] if idx > 0 else ["disabled"])
@@ -223,15 +969,15 @@ class WizardApp:
         else:
             self.bottom_brand.config(text="joediggidyyy")
         
-        # Update navigation state after UI is ready
-        self.root.after(50, self._update_nav_state)
+        # Update navigation state once the new step has been laid out
+        self._schedule_nav_state()
 
     def _next(self):
         # Collect data from current step
         frame = self._active_frame
-        if frame is not None and hasattr(frame, "collect"):
-            if frame.collect() is False:  # type: ignore[attr-defined]
-                return
+        collect = getattr(frame, "collect", None)
+        if collect is not None and collect() is False:
+            return
         
         # Check validation requirements before proceeding
         if not self._check_nav_lock():
@@ -246,7 +992,7 @@ class WizardApp:
         """Check if navigation should be locked due to required validations."""
         # Step 2 (Project Setup) - check GitHub
         if self.current == 1:
-            if hasattr(self, 'github_enabled_var') and self.github_enabled_var.get():
+            if self.github_enabled_var is not None and self.github_enabled_var.get():
                 if not self.validations.get('github', False):
                     messagebox.showwarning("Validation Required",
                                          "Please validate GitHub connection before proceeding,\n"
@@ -255,14 +1001,14 @@ class WizardApp:
         
         # Step 3 (Alert Preferences) - check email/slack
         if self.current == 2:
-            if hasattr(self, 'email_var') and self.email_var.get():
+            if self.email_var is not None and self.email_var.get():
                 if not self.validations.get('email', False):
                     messagebox.showwarning("Validation Required", 
                                          "Please test and validate email configuration before proceeding,\n"
                                          "or uncheck the email option.")
                     return False
             
-            if hasattr(self, 'slack_var') and self.slack_var.get():
+            if self.slack_var is not None and self.slack_var.get():
                 if not self.validations.get('slack', False):
                     messagebox.showwarning("Validation Required",
                                          "Please test and validate Slack configuration before proceeding,\n"
@@ -271,11 +1017,18 @@ class WizardApp:
         
         return True
     
+    def _schedule_nav_state(self):
+        """Coalesce a burst of toggle/validation changes into one idle-time nav update."""
+        if not self._nav_pending:
+            self._nav_pending = True
+            self.root.after_idle(self._update_nav_state)
+
     def _update_nav_state(self):
         """Update navigation button states based on validation requirements."""
+        self._nav_pending = False
         if self.current == 1:  # Project Setup step (GitHub)
             # Check if GitHub validation is needed
-            github_needs_validation = (hasattr(self, 'github_enabled_var') and self.github_enabled_var.get() and 
+            github_needs_validation = (self.github_enabled_var is not None and self.github_enabled_var.get() and 
                                       not self.validations.get('github', False))
             
             if github_needs_validation:
@@ -287,9 +1040,9 @@ class WizardApp:
         
         elif self.current == 2:  # Alert step
             # Check if validation is needed
-            email_needs_validation = (hasattr(self, 'email_var') and self.email_var.get() and 
+            email_needs_validation = (self.email_var is not None and self.email_var.get() and 
                                      not self.validations.get('email', False))
-            slack_needs_validation = (hasattr(self, 'slack_var') and self.slack_var.get() and 
+            slack_needs_validation = (self.slack_var is not None and self.slack_var.get() and 
                                      not self.validations.get('slack', False))
             
             if email_needs_validation or slack_needs_validation:
@@ -301,6 +1054,9 @@ class WizardApp:
             else:
                 self.next_btn.config(state="normal", text="Next →")
         
+        elif self.current == 3 and not self._ide_rows_ready:  # IDE step, scan still running
+            self.next_btn.config(state="disabled", text="Scanning IDEs...")
+        
         else:
             # Normal navigation for other steps
             is_last = self.current == len(self.steps) - 1
@@ -312,16 +1068,19 @@ class WizardApp:
 
     # ---- step builders ----
     def _build_steps(self):
-        self.steps = [
-            ("Welcome", self._step_welcome),
-            ("Project Setup", self._step_location),
-            ("Alert Preferences", self._step_alerts),
-            ("IDE Integration", self._step_ide),
-            ("GitHub Copilot Integration", self._step_copilot),
-            ("Optional Features", self._step_optional),
-            ("Document Formatting", self._step_formatting),
-            ("Summary", self._step_summary),
-        ]
+        # Bound once; _show_step only indexes into this tuple.
+        # Steps whose content is derived from earlier answers are rebuilt on
+        # every visit; the rest keep their widgets (and user input) alive.
+        self.steps = (
+            ("Welcome", self._step_welcome, False),
+            ("Project Setup", self._step_location, True),
+            ("Alert Preferences", self._step_alerts, True),
+            ("IDE Integration", self._step_ide, True),
+            ("GitHub Copilot Integration", self._step_copilot, False),
+            ("Optional Features", self._step_optional, False),
+            ("Document Formatting", self._step_formatting, True),
+            ("Summary", self._step_summary, False),
+        )
 
     def _step_welcome(self):
         # Use regular Frame instead of ScrollableFrame for Welcome page
@@ -329,7 +1088,7 @@ class WizardApp:
         
         # Compact welcome header
         ttk.Label(f, text="Welcome to CodeSentinel! This wizard will guide you through project setup and configuration.", 
-                 font=('Arial', 9), justify="left", foreground="#333333", wraplength=850).pack(
+                 font='WizardBody', justify="left", foreground="#333333", wraplength=850).pack(
                      anchor="w", pady=(0, 10))
         
         # Two-column layout
@@ -341,25 +1100,23 @@ class WizardApp:
         left_column.pack(side="left", fill="both", expand=True, padx=(0, 6))
         
         # Installation Progress
-        progress_frame = ttk.LabelFrame(left_column, text="⚙️ Installation Progress", padding=10)
-        progress_frame.pack(fill="both", expand=True, pady=(0, 6))
+        progress_frame = self._section(left_column, "⚙️ Installation Progress", fill="both", expand=True, pady=(0, 6))
         
         self.install_progress = ttk.Progressbar(progress_frame, mode='determinate')
         self.install_progress.pack(fill="x", pady=(0, 4))
         self.install_progress['value'] = 100
         
         ttk.Label(progress_frame, text="✓ Installation complete!", 
-                 font=('Arial', 9, 'bold'), foreground=self.colors['success']).pack(anchor="w", pady=(0, 4))
+                 font='WizardBodyBold', foreground=self.colors['success']).pack(anchor="w", pady=(0, 4))
         
         ttk.Label(progress_frame, text="Available commands:\n  codesentinel-setup  - Setup wizard\n  codesentinel        - Main CLI\n  codesentinel !!!!   - Audit mode", 
-                 font=('Courier New', 8), justify="left", foreground="#424242").pack(anchor="w")
+                 font='WizardMono', justify="left", foreground="#424242").pack(anchor="w")
         
         # What CodeSentinel Provides
-        provides_frame = ttk.LabelFrame(left_column, text=" What CodeSentinel Provides", padding=10)
-        provides_frame.pack(fill="both", expand=True, pady=(6, 0))
+        provides_frame = self._section(left_column, " What CodeSentinel Provides", fill="both", expand=True, pady=(6, 0))
         
         features_text = "• Automated security monitoring\n• Multi-channel alert system\n• GitHub & Copilot AI integration\n• IDE integration support\n• Intelligent audit with '!!!!' command\n• Non-destructive automation"
-        ttk.Label(provides_frame, text=features_text, font=('Arial', 9), 
+        ttk.Label(provides_frame, text=features_text, font='WizardBody', 
                  justify="left", foreground="#333333").pack(anchor="w")
         
         # Right column
@@ -367,38 +1124,35 @@ class WizardApp:
         right_column.pack(side="left", fill="both", expand=True, padx=(6, 0))
         
         # Environment Information
-        env_frame = ttk.LabelFrame(right_column, text=" Environment Information", padding=10)
-        env_frame.pack(fill="both", expand=True, pady=(0, 6))
+        env_frame = self._section(right_column, " Environment Information", fill="both", expand=True, pady=(0, 6))
         
-        current_dir = Path.cwd()
+        current_dir = self._cwd
         install_loc = self.data.get("install_location", str(current_dir))
-        is_git_repo = (current_dir / ".git").exists()
-        python_version = f"{sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}"
+        is_git_repo = self._cwd_is_git
         
         env_items = [
             ("Current Directory:", str(current_dir)),
             ("Install Location:", install_loc),
             ("Git Repository:", "✓ Detected" if is_git_repo else "Not detected"),
             ("Mode:", "Repository Integration" if is_git_repo else "Standalone"),
-            ("Python Version:", python_version),
+            ("Python Version:", _PYTHON_VERSION),
         ]
         
-        for label, value in env_items:
-            item_frame = ttk.Frame(env_frame)
-            item_frame.pack(fill="x", pady=1)
-            ttk.Label(item_frame, text=label, font=('Arial', 9, 'bold'), 
-                     width=18).pack(side="left", anchor="w")
+        # Label/value pairs share one grid instead of a frame per row
+        env_frame.columnconfigure(1, weight=1)
+        for row, (label, value) in enumerate(env_items):
+            ttk.Label(env_frame, text=label, font='WizardBodyBold', 
+                     width=18).grid(row=row, column=0, sticky="nw", pady=1)
             color = self.colors['success'] if "✓" in value else "#424242"
-            ttk.Label(item_frame, text=value, font=('Arial', 9), 
-                     foreground=color, wraplength=350).pack(side="left", anchor="w", fill="x", expand=True)
+            ttk.Label(env_frame, text=value, font='WizardBody', 
+                     foreground=color, wraplength=350).grid(row=row, column=1, sticky="ew", pady=1)
         
         # Getting Started
-        start_frame = ttk.LabelFrame(right_column, text=" Getting Started", padding=10)
-        start_frame.pack(fill="both", expand=True, pady=(6, 0))
+        start_frame = self._section(right_column, " Getting Started", fill="both", expand=True, pady=(6, 0))
         
         start_text = "This wizard will help you configure:\n\n1. Project location and GitHub setup\n2. Alert channel preferences\n3. IDE integration options\n4. GitHub Copilot integration\n5. Optional automation features\n\nClick 'Next' to begin configuration."
         
-        ttk.Label(start_frame, text=start_text, font=('Arial', 9), 
+        ttk.Label(start_frame, text=start_text, font='WizardBody', 
                  justify="left", foreground="#333333").pack(anchor="w")
 
         # Repository link (clickable)
@@ -415,7 +1169,7 @@ class WizardApp:
         
         # Compact header
         ttk.Label(f, text="Configure your installation location and GitHub integration.", 
-                 font=('Arial', 9), foreground='gray').pack(anchor="w", pady=(0, 10))
+                 style='Intro.TLabel').pack(anchor="w", pady=(0, 10))
         
         # Two-column layout
         columns_container = ttk.Frame(f)
@@ -425,40 +1179,30 @@ class WizardApp:
         left_column = ttk.Frame(columns_container)
         left_column.pack(side="left", fill="both", expand=True, padx=(0, 6))
         
-        location_frame = ttk.LabelFrame(left_column, text=" Installation Location", padding=10)
-        location_frame.pack(fill="both", expand=True)
+        location_frame = self._section(left_column, " Installation Location", fill="both", expand=True)
         
         self.loc_var = tk.StringVar(value=self.data["install_location"])
         
         # Install location entry
         ttk.Label(location_frame, text="Install location (project root):", 
-                 font=('Arial', 9)).pack(anchor="w", pady=(0, 4))
+                 font='WizardBody').pack(anchor="w", pady=(0, 4))
         
         entry_row = ttk.Frame(location_frame)
         entry_row.pack(fill="x", pady=(0, 8))
-        ttk.Entry(entry_row, textvariable=self.loc_var, font=('Arial', 9)).pack(side="left", fill="x", expand=True)
+        ttk.Entry(entry_row, textvariable=self.loc_var, font='WizardBody').pack(side="left", fill="x", expand=True)
         ttk.Button(entry_row, text="Browse...", command=self._browse_location).pack(side="left", padx=(8, 0))
         
-        # Detected repositories section
-        detected_repos = self._detect_git_repos()
-        if detected_repos:
-            ttk.Label(location_frame, text="Detected Git Repositories:", 
-                     font=('Arial', 9, 'bold')).pack(anchor="w", pady=(8, 4))
-            
-            self.repo_list = tk.Listbox(location_frame, height=8, font=('Arial', 9))
-            self.repo_list.pack(fill="both", expand=True, pady=(0, 6))
-            for p in detected_repos:
-                self.repo_list.insert(tk.END, str(p))
-            
-            ttk.Button(location_frame, text="Use Selected Repository", 
-                      command=self._use_selected_repo).pack(anchor="e")
+        # Detected repositories section: the filesystem scan runs on the I/O pool
+        # and the list is filled in after the step has painted
+        repos_frame = ttk.Frame(location_frame)
+        repos_frame.pack(fill="both", expand=True)
+        self._submit_io(self._detect_git_repos, self._show_detected_repos, repos_frame)
         
         # Right column - GitHub Integration
         right_column = ttk.Frame(columns_container)
         right_column.pack(side="left", fill="both", expand=True, padx=(6, 0))
         
-        github_frame = ttk.LabelFrame(right_column, text=" GitHub Integration", padding=10)
-        github_frame.pack(fill="both", expand=True)
+        github_frame = self._section(right_column, " GitHub Integration", fill="both", expand=True)
         
         # Enable GitHub checkbox
         self.github_enabled_var = tk.BooleanVar(value=self.data["github"].get("enabled", False))
@@ -472,50 +1216,47 @@ class WizardApp:
         
         # Integration mode - compact
         ttk.Label(self.github_config_frame, text="Integration Mode:", 
-                 font=('Arial', 9, 'bold')).pack(anchor="w", pady=(0, 4))
+                 font='WizardBodyBold').pack(anchor="w", pady=(0, 4))
         
         self.gh_mode = tk.StringVar(value=self.data["github"].get("mode", "connect"))
-        modes = [
-            ("initialize", " Initialize New Repository"),
-            ("clone", " Clone Existing Repository"),
-            ("connect", " Connect to Existing Remote")
-        ]
-        
-        for value, label in modes:
+        for value, label in _GITHUB_MODES:
             ttk.Radiobutton(self.github_config_frame, text=label, 
                           variable=self.gh_mode, value=value).pack(anchor="w", pady=2)
         
         # Repository URL
         ttk.Label(self.github_config_frame, text="Repository URL:", 
-                 font=('Arial', 9)).pack(anchor="w", pady=(8, 4))
+                 font='WizardBody').pack(anchor="w", pady=(8, 4))
         self.gh_url = tk.StringVar(value=self.data["github"].get("repo_url", ""))
         ttk.Entry(self.github_config_frame, textvariable=self.gh_url, 
-                 font=('Arial', 9)).pack(fill="x", pady=(0, 2))
+                 font='WizardBody').pack(fill="x", pady=(0, 2))
         ttk.Label(self.github_config_frame, text="Example: https://github.com/username/repo", 
-                 font=('Arial', 8), foreground='gray').pack(anchor="w", pady=(0, 6))
+                 style='Hint.TLabel').pack(anchor="w", pady=(0, 6))
         
         # Access Token
         ttk.Label(self.github_config_frame, text="Personal Access Token (optional):", 
-                 font=('Arial', 9)).pack(anchor="w", pady=(0, 4))
+                 font='WizardBody').pack(anchor="w", pady=(0, 4))
         self.gh_token = tk.StringVar(value=self.data["github"].get("access_token", ""))
         ttk.Entry(self.github_config_frame, textvariable=self.gh_token, 
-                 font=('Arial', 9), show="*").pack(fill="x", pady=(0, 2))
+                 font='WizardBody', show="*").pack(fill="x", pady=(0, 2))
         ttk.Label(self.github_config_frame, text="Generate at: github.com/settings/tokens", 
-                 font=('Arial', 8), foreground='gray').pack(anchor="w", pady=(0, 8))
+                 style='Hint.TLabel').pack(anchor="w", pady=(0, 8))
         
         # Validation
         validation_frame = ttk.Frame(self.github_config_frame)
         validation_frame.pack(fill="x")
-        ttk.Button(validation_frame, text="🔍 Validate", 
-                  command=self._validate_github).pack(side="left")
-        self.github_status = ttk.Label(validation_frame, text="", font=('Arial', 9))
+        validate_btn = ttk.Button(validation_frame, text="🔍 Validate", 
+                                 command=self._validate_github)
+        validate_btn.pack(side="left")
+        # Shift-click forces a fresh lookup instead of a cached result
+        validate_btn.bind("<Shift-Button-1>", lambda e: self._github_probe_cache.clear())
+        self.github_status = ttk.Label(validation_frame, text="", font='WizardBody')
         self.github_status.pack(side="left", padx=(10, 0))
         
         # Set initial state
         self._on_github_toggle()
         
         def collect():
-            self.data["install_location"] = self.loc_var.get().strip() or str(Path.cwd())
+            self.data["install_location"] = self.loc_var.get().strip() or str(self._cwd)
             self.data["github"]["enabled"] = bool(self.github_enabled_var.get())
             self.data["github"]["mode"] = self.gh_mode.get()
             self.data["github"]["repo_url"] = self.gh_url.get().strip()
@@ -528,8 +1269,7 @@ class WizardApp:
         alerts = self.data["alerts"]
 
         # Alert Channels - Horizontal Layout
-        channels = ttk.LabelFrame(f, text=" Alert Channels", padding=12)
-        channels.pack(fill="x", pady=(0, 12))
+        channels = self._section(f, " Alert Channels", padding=12, fill="x", pady=(0, 12))
         
         self.console_var = tk.BooleanVar(value=alerts["console"]["enabled"]) 
         self.file_var = tk.BooleanVar(value=alerts["file"]["enabled"]) 
@@ -555,15 +1295,13 @@ class WizardApp:
         left_column.pack(side="left", fill="both", expand=True, padx=(0, 6))
         
         # File Logging Configuration
-        filebox = ttk.LabelFrame(left_column, text=" File Logging Configuration", padding=12)
-        filebox.pack(fill="x", pady=(0, 12))
+        filebox = self._section(left_column, " File Logging Configuration", padding=12, fill="x", pady=(0, 12))
         self.log_file_var = tk.StringVar(value=alerts["file"]["log_file"]) 
-        ttk.Label(filebox, text="Log file path:", font=('Arial', 9)).pack(anchor="w", pady=(0, 4))
-        ttk.Entry(filebox, textvariable=self.log_file_var, font=('Arial', 9)).pack(fill="x")
+        ttk.Label(filebox, text="Log file path:", font='WizardBody').pack(anchor="w", pady=(0, 4))
+        ttk.Entry(filebox, textvariable=self.log_file_var, font='WizardBody').pack(fill="x")
         
         # Email Configuration
-        email = ttk.LabelFrame(left_column, text=" Email Alert Configuration", padding=12)
-        email.pack(fill="both", expand=True)
+        email = self._section(left_column, " Email Alert Configuration", padding=12, fill="both", expand=True)
         
         self.smtp_server_var = tk.StringVar(value=alerts["email"].get("smtp_server", "smtp.gmail.com"))
         self.smtp_port_var = tk.StringVar(value=str(alerts["email"].get("smtp_port", 587)))
@@ -581,19 +1319,20 @@ class WizardApp:
             ("To (comma-separated):", self.to_emails_var, False),
         ]
         
-        for lbl, var, is_password in email_fields:
-            row_frame = ttk.Frame(email)
-            row_frame.pack(fill="x", pady=2)
-            ttk.Label(row_frame, text=lbl, font=('Arial', 9), width=20).pack(side="left", anchor="w")
-            ttk.Entry(row_frame, textvariable=var, font=('Arial', 9), 
-                     show='*' if is_password else '').pack(side="left", fill="x", expand=True)
+        fields_grid = ttk.Frame(email)
+        fields_grid.pack(fill="x")
+        fields_grid.columnconfigure(1, weight=1)
+        for row, (lbl, var, is_password) in enumerate(email_fields):
+            ttk.Label(fields_grid, text=lbl, font='WizardBody', width=20).grid(row=row, column=0, sticky="w", pady=2)
+            ttk.Entry(fields_grid, textvariable=var, font='WizardBody', 
+                     show='*' if is_password else '').grid(row=row, column=1, sticky="ew", pady=2)
         
         # Email validation
         email_val_frame = ttk.Frame(email)
         email_val_frame.pack(fill="x", pady=(8, 0))
         ttk.Button(email_val_frame, text="🔍 Test Configuration", 
                   command=self._validate_email).pack(side="left")
-        self.email_status = ttk.Label(email_val_frame, text="", font=('Arial', 9))
+        self.email_status = ttk.Label(email_val_frame, text="", font='WizardBody')
         self.email_status.pack(side="left", padx=(10, 0))
         
         # Right Column
@@ -601,8 +1340,7 @@ class WizardApp:
         right_column.pack(side="left", fill="both", expand=True, padx=(6, 0))
         
         # Slack Configuration
-        slack = ttk.LabelFrame(right_column, text=" Slack Integration Configuration", padding=12)
-        slack.pack(fill="x")
+        slack = self._section(right_column, " Slack Integration Configuration", padding=12, fill="x")
         
         self.slack_url_var = tk.StringVar(value=alerts["slack"].get("webhook_url", ""))
         self.slack_channel_var = tk.StringVar(value=alerts["slack"].get("channel", "#maintenance-alerts"))
@@ -610,21 +1348,21 @@ class WizardApp:
         # Webhook URL
         url_frame = ttk.Frame(slack)
         url_frame.pack(fill="x", pady=(0, 8))
-        ttk.Label(url_frame, text="Webhook URL:", font=('Arial', 9)).pack(anchor="w", pady=(0, 4))
-        ttk.Entry(url_frame, textvariable=self.slack_url_var, font=('Arial', 9)).pack(fill="x")
+        ttk.Label(url_frame, text="Webhook URL:", font='WizardBody').pack(anchor="w", pady=(0, 4))
+        ttk.Entry(url_frame, textvariable=self.slack_url_var, font='WizardBody').pack(fill="x")
         
         # Channel
         channel_frame = ttk.Frame(slack)
         channel_frame.pack(fill="x", pady=(0, 8))
-        ttk.Label(channel_frame, text="Channel:", font=('Arial', 9)).pack(anchor="w", pady=(0, 4))
-        ttk.Entry(channel_frame, textvariable=self.slack_channel_var, font=('Arial', 9)).pack(fill="x")
+        ttk.Label(channel_frame, text="Channel:", font='WizardBody').pack(anchor="w", pady=(0, 4))
+        ttk.Entry(channel_frame, textvariable=self.slack_channel_var, font='WizardBody').pack(fill="x")
         
         # Slack validation
         slack_val_frame = ttk.Frame(slack)
         slack_val_frame.pack(fill="x", pady=(8, 0))
         ttk.Button(slack_val_frame, text="🔍 Test Connection", 
                   command=self._validate_slack).pack(side="left")
-        self.slack_status = ttk.Label(slack_val_frame, text="", font=('Arial', 9))
+        self.slack_status = ttk.Label(slack_val_frame, text="", font='WizardBody')
         self.slack_status.pack(side="left", padx=(10, 0))
 
         def collect():
@@ -638,7 +1376,7 @@ class WizardApp:
                 "username": self.email_user_var.get().strip(),
                 "password": self.email_pass_var.get(),
                 "from_email": self.from_email_var.get().strip(),
-                "to_emails": [e.strip() for e in self.to_emails_var.get().split(',') if e.strip()],
+                "to_emails": _parse_recipients(self.to_emails_var.get()),
             })
             alerts["slack"]["enabled"] = bool(self.slack_var.get())
             alerts["slack"].update({
@@ -648,14 +1386,80 @@ class WizardApp:
         f.collect = collect  # type: ignore
         return f
     
+    def _submit_io(self, fn: Callable[[], Any], on_done: Callable[..., Any], *args: Any):
+        """Run ``fn`` on the I/O pool; ``on_done(future, *args)`` then runs on the Tk thread."""
+        self._when_done(self._io_pool.submit(fn), on_done, *args)
+
+    def _when_done(self, future: Future, on_done: Callable[..., Any], *args: Any):
+        """Call ``on_done(future, *args)`` on the Tk thread once ``future`` finishes."""
+        self._io_jobs += 1
+        future.add_done_callback(
+            lambda future: self._ui_queue.put((on_done, (future, *args))))
+        if not self._ui_pump_armed:
+            self._ui_pump_armed = True
+            self.root.after(50, self._drain_ui_queue)
+
+    def _drain_ui_queue(self):
+        """Run callbacks queued by worker threads on the Tk thread.
+
+        Re-arms only while submitted jobs are outstanding, so an idle wizard
+        has no polling timer.
+        """
+        try:
+            while True:
+                try:
+                    callback, args = self._ui_queue.get_nowait()
+                except queue.Empty:
+                    break
+                self._io_jobs -= 1
+                callback(*args)
+        finally:
+            if self._io_jobs > 0:
+                self.root.after(50, self._drain_ui_queue)
+            else:
+                self._ui_pump_armed = False
+
+    def _run_probe(self, probe: Callable[[], Tuple[str, str, bool]], status: ttk.Label, key: str,
+                   inputs: Tuple[Any, ...],
+                   on_result: Optional[Callable[[Tuple[str, str, bool]], None]] = None):
+        """Run a blocking validation probe on the I/O pool.
+
+        ``probe`` returns ``(status_text, color_key, valid)``; the result is
+        handed back to the Tk thread by _submit_io. ``inputs`` identify
+        what is being validated: repeat clicks while the same check is still
+        running are ignored, and results for superseded inputs are dropped.
+        ``on_result``, if given, receives a successful result on the Tk thread.
+        """
+        if self._probes_in_flight.get(key) == inputs:
+            return
+        self._probes_in_flight[key] = inputs
+        self._submit_io(probe, self._finish_probe, status, key, inputs, on_result)
+
+    def _finish_probe(self, future: Future, status: ttk.Label, key: str, inputs: Tuple[Any, ...],
+                      on_result: Optional[Callable[[Tuple[str, str, bool]], None]] = None):
+        """Apply a finished probe result to its status label and validation flag."""
+        if self._probes_in_flight.get(key) != inputs:
+            # A newer check for different inputs owns the status label
+            return
+        del self._probes_in_flight[key]
+        try:
+            text, color, valid = future.result()
+        except Exception as e:
+            text, color, valid = f"❌ Error: {str(e)[:30]}...", 'error', False
+        else:
+            if on_result is not None:
+                on_result((text, color, valid))
+        if status.winfo_exists():
+            status.config(text=text, foreground=self.colors[color])
+        self.validations[key] = valid
+        self._schedule_nav_state()
+
     def _validate_email(self):
         """Validate email configuration."""
         self.email_status.config(text="🔍 Testing...", foreground=self.colors['processing'])
-        self.root.update()
         
         try:
-            import smtplib
-            from email.mime.text import MIMEText
+            import smtplib  # deferred: only needed when the test button is used
             
             server = self.smtp_server_var.get().strip()
             port = int(self.smtp_port_var.get() or 587)
@@ -666,67 +1470,57 @@ class WizardApp:
             if not all([server, username, password, from_addr]):
                 self.email_status.config(text="❌ Missing required fields", foreground=self.colors['error'])
                 self.validations['email'] = False
-                self._update_nav_state()
+                self._schedule_nav_state()
                 return
-            
+        except Exception as e:
+            self.email_status.config(text=f"❌ Error: {str(e)[:30]}...", foreground=self.colors['error'])
+            self.validations['email'] = False
+            self._schedule_nav_state()
+            return
+
+        def probe():
             # Test connection
             smtp = smtplib.SMTP(server, port, timeout=10)
             smtp.starttls()
             smtp.login(username, password)
             smtp.quit()
-            
-            self.email_status.config(text="✓ Configuration valid", foreground=self.colors['success'])
-            self.validations['email'] = True
-            self._update_nav_state()
-        except Exception as e:
-            self.email_status.config(text=f"❌ Error: {str(e)[:30]}...", foreground=self.colors['error'])
-            self.validations['email'] = False
-            self._update_nav_state()
+            return "✓ Configuration valid", 'success', True
+
+        self._run_probe(probe, self.email_status, 'email', (server, port, username, password))
     
     def _validate_slack(self):
         """Validate Slack webhook."""
         self.slack_status.config(text="🔍 Testing...", foreground=self.colors['processing'])
-        self.root.update()
         
-        try:
-            import json
-            import urllib.request
-            from urllib.parse import urlparse
+        import urllib.request
+        from .utils.alerts import is_valid_slack_webhook
 
-            webhook_url = self.slack_url_var.get().strip()
+        webhook_url = self.slack_url_var.get().strip()
 
-            if not webhook_url:
-                self.slack_status.config(text="❌ Webhook URL required", foreground=self.colors['error'])
-                self.validations['slack'] = False
-                self._update_nav_state()
-                return
+        if not webhook_url:
+            self.slack_status.config(text="❌ Webhook URL required", foreground=self.colors['error'])
+            self.validations['slack'] = False
+            self._schedule_nav_state()
+            return
 
-            # Basic allowlist validation to prevent SSRF: only allow Slack webhooks
-            parsed = urlparse(webhook_url)
-            host = (parsed.hostname or "").lower()
-            if not (parsed.scheme == "https" and host and (host == "hooks.slack.com" or host.endswith(".slack.com")) and "/services/" in parsed.path):
-                self.slack_status.config(text="❌ Invalid Slack webhook URL", foreground=self.colors['error'])
-                self.validations['slack'] = False
-                self._update_nav_state()
-                return
+        # Basic allowlist validation to prevent SSRF: only allow Slack webhooks
+        if not is_valid_slack_webhook(webhook_url):
+            self.slack_status.config(text="❌ Invalid Slack webhook URL", foreground=self.colors['error'])
+            self.validations['slack'] = False
+            self._schedule_nav_state()
+            return
 
+        def probe():
             # Test webhook with a test message
             data = json.dumps({"text": "CodeSentinel test message"}).encode('utf-8')
             req = urllib.request.Request(webhook_url, data=data, headers={'Content-Type': 'application/json'})
             response = urllib.request.urlopen(req, timeout=10)
 
             if response.status == 200:
-                self.slack_status.config(text="✓ Webhook valid", foreground=self.colors['success'])
-                self.validations['slack'] = True
-                self._update_nav_state()
-            else:
-                self.slack_status.config(text=f"❌ HTTP {response.status}", foreground=self.colors['error'])
-                self.validations['slack'] = False
-                self._update_nav_state()
-        except Exception as e:
-            self.slack_status.config(text=f"❌ Error: {str(e)[:30]}...", foreground=self.colors['error'])
-            self.validations['slack'] = False
-            self._update_nav_state()
+                return "✓ Webhook valid", 'success', True
+            return f"❌ HTTP {response.status}", 'error', False
+
+        self._run_probe(probe, self.slack_status, 'slack', (webhook_url,))
 
     def _on_email_toggle(self):
         """Handle email checkbox toggle - reset validation state."""
@@ -738,7 +1532,7 @@ class WizardApp:
             # Disabled - no validation needed
             self.validations['email'] = True
             self.email_status.config(text="", foreground="black")
-        self._update_nav_state()
+        self._schedule_nav_state()
     
     def _on_slack_toggle(self):
         """Handle Slack checkbox toggle - reset validation state."""
@@ -750,7 +1544,7 @@ class WizardApp:
             # Disabled - no validation needed
             self.validations['slack'] = True
             self.slack_status.config(text="", foreground="black")
-        self._update_nav_state()
+        self._schedule_nav_state()
 
     
     def _on_github_toggle(self):
@@ -759,7 +1553,7 @@ class WizardApp:
         state = "normal" if enabled else "disabled"
         
         # Enable/disable all widgets in the config frame
-        for child in self.github_config_frame.winfo_children():
+        for child in self.github_config_frame.children.values():
             self._set_widget_state_recursive(child, state)
         
         # Update validation state
@@ -772,7 +1566,7 @@ class WizardApp:
             self.github_status.config(text="⚠️ Not validated", foreground=self.colors['warning'])
         
         # Update navigation
-        self.root.after(10, self._update_nav_state)
+        self._schedule_nav_state()
     
     def _set_widget_state_recursive(self, widget, state):
         """Recursively set state of all child widgets."""
@@ -782,72 +1576,76 @@ class WizardApp:
         except:
             pass
         
-        for child in widget.winfo_children():
+        for child in widget.children.values():
             self._set_widget_state_recursive(child, state)
     
     def _validate_github(self):
         """Validate GitHub repository connection."""
         self.github_status.config(text="🔍 Validating...", foreground=self.colors['processing'])
-        self.root.update()
         
-        try:
-            import urllib.request
-            import urllib.error
-            
-            url = self.gh_url.get().strip()
-            token = self.gh_token.get().strip()
-            
-            if not url:
-                self.github_status.config(text="❌ Please enter a repository URL", foreground=self.colors['error'])
-                self.validations['github'] = False
-                self._update_nav_state()
-                return
-            
-            # Validate GitHub URL format
-            if not ('github.com' in url.lower()):
-                self.github_status.config(text="❌ Please enter a valid GitHub URL", foreground=self.colors['error'])
-                self.validations['github'] = False
-                self._update_nav_state()
-                return
-            
-            # Extract owner/repo from URL
-            parts = url.rstrip('/').split('/')
-            if len(parts) >= 2:
-                owner, repo = parts[-2], parts[-1].replace('.git', '')
-                api_url = f"https://api.github.com/repos/{owner}/{repo}"
-                
-                req = urllib.request.Request(api_url)
-                req.add_header('User-Agent', 'CodeSentinel-Setup')
-                
-                # Add authorization header if token provided
-                if token:
-                    req.add_header('Authorization', f'token {token}')
-                
-                try:
-                    response = urllib.request.urlopen(req, timeout=10)
-                    if response.status == 200:
-                        self.github_status.config(text="✓ Repository accessible", foreground=self.colors['success'])
-                        self.validations['github'] = True
-                    else:
-                        self.github_status.config(text=f"❌ HTTP {response.status}", foreground=self.colors['error'])
-                        self.validations['github'] = False
-                except urllib.error.HTTPError as e:
-                    if e.code == 404:
-                        self.github_status.config(text="❌ Repository not found", foreground=self.colors['error'])
-                    elif e.code == 401:
-                        self.github_status.config(text="❌ Invalid access token", foreground=self.colors['error'])
-                    else:
-                        self.github_status.config(text=f"❌ HTTP {e.code}", foreground=self.colors['error'])
-                    self.validations['github'] = False
-            else:
-                self.github_status.config(text="❌ Invalid URL format", foreground=self.colors['error'])
-                self.validations['github'] = False
-                
-        except Exception as e:
-            self.github_status.config(text=f"❌ Error: {str(e)[:30]}...", foreground=self.colors['error'])
+        import urllib.request
+        import urllib.error
+        
+        url = self.gh_url.get().strip()
+        token = self.gh_token.get().strip()
+        
+        if not url:
+            self.github_status.config(text="❌ Please enter a repository URL", foreground=self.colors['error'])
             self.validations['github'] = False
+            self._schedule_nav_state()
+            return
         
-        self._update_nav_state()
+        # Validate the URL format locally so malformed input never hits the network
+        owner_repo = _parse_github_repo(url)
+        if owner_repo is None:
+            self.github_status.config(text="❌ Please enter a valid GitHub URL", foreground=self.colors['error'])
+            self.validations['github'] = False
+            self._schedule_nav_state()
+            return
+
+        owner, repo = owner_repo
+        api_url = f"https://api.github.com/repos/{owner}/{repo}"
+
+        cache_key = (api_url, token)
+        cached = self._github_probe_cache.get(cache_key)
+        if cached is not None and time.monotonic() - cached[0] < _GITHUB_PROBE_TTL:
+            text, color, valid = cached[1]
+            self.github_status.config(text=text, foreground=self.colors[color])
+            self.validations['github'] = valid
+            self._schedule_nav_state()
+            return
+
+        # Only these answers are stable enough to reuse; 5xx, rate limits and
+        # network errors are retried on the next click
+        found = ("✓ Repository accessible", 'success', True)
+        missing = ("❌ Repository not found", 'error', False)
+        denied = ("❌ Invalid access token", 'error', False)
+
+        def remember(result):
+            if result in (found, missing, denied):
+                self._github_probe_cache[cache_key] = (time.monotonic(), result)
+
+        def lookup():
+            req = urllib.request.Request(api_url)
+            req.add_header('User-Agent', 'CodeSentinel-Setup')
+            
+            # Add authorization header if token provided
+            if token:
+                req.add_header('Authorization', f'token {token}')
+            
+            try:
+                response = urllib.request.urlopen(req, timeout=10)
+            except urllib.error.HTTPError as e:
+                if e.code == 404:
+                    return missing
+                if e.code == 401:
+                    return denied
+                return f"❌ HTTP {e.code}", 'error', False
+            if response.status == 200:
+                return found
+            return f"❌ HTTP {response.status}", 'error', False
+
+        self._run_probe(lookup, self.github_status, 'github', cache_key, remember)
 
     def _step_ide(self):
         # Compact, non-scroll implementation to avoid occluding footer
@@ -855,215 +1653,43 @@ class WizardApp:
         
         # Compact header
         ttk.Label(f, text="Configure integration with your development environment.", 
-                 font=('Arial', 9), foreground='gray').pack(anchor="w", pady=(0, 8))
+                 style='Intro.TLabel').pack(anchor="w", pady=(0, 8))
         
         # IDE Support Section
-        ide_frame = ttk.LabelFrame(f, text="🔍 Detected IDEs", padding=10)
         # Do not expand to avoid pushing into footer; allow wrapping into two columns
-        ide_frame.pack(fill="x", expand=False, pady=(0, 6))
+        ide_frame = self._section(f, "🔍 Detected IDEs", fill="x", expand=False, pady=(0, 6))
         grid_frame = ttk.Frame(ide_frame)
         grid_frame.pack(fill="x", expand=False)
-        grid_frame.columnconfigure(0, weight=1)
+        # Two IDE columns, each spanning checkbox / name+description / download cells
         grid_frame.columnconfigure(1, weight=1)
+        grid_frame.columnconfigure(4, weight=1)
         
-        # Define IDE configurations with detection commands
-        ide_configs = [
-            {
-                'name': 'Visual Studio Code',
-                'key': 'VS Code',
-                'description': 'Lightweight, extensible code editor',
-                'commands': ['code'],
-                'paths': [
-                    'C:\\Users\\{username}\\AppData\\Local\\Programs\\Microsoft VS Code\\Code.exe',
-                    'C:\\Program Files\\Microsoft VS Code\\Code.exe',
-                    'C:\\Program Files (x86)\\Microsoft VS Code\\Code.exe'
-                ],
-                'icon': '',
-                'url': 'https://code.visualstudio.com/'
-            },
-            {
-                'name': 'Visual Studio',
-                'key': 'Visual Studio',
-                'description': 'Full-featured IDE for .NET and C++',
-                'commands': ['devenv'],
-                'paths': [
-                    'C:\\Program Files\\Microsoft Visual Studio\\2022\\*\\Common7\\IDE\\devenv.exe',
-                    'C:\\Program Files (x86)\\Microsoft Visual Studio\\2019\\*\\Common7\\IDE\\devenv.exe',
-                    'C:\\Program Files (x86)\\Microsoft Visual Studio\\2017\\*\\Common7\\IDE\\devenv.exe'
-                ],
-                'icon': '',
-                'url': 'https://visualstudio.microsoft.com/'
-            },
-            {
-                'name': 'PyCharm',
-                'key': 'PyCharm',
-                'description': 'Python-focused IDE by JetBrains',
-                'commands': ['pycharm64', 'charm', 'pycharm'],
-                'paths': [
-                    'C:\\Users\\{username}\\AppData\\Local\\JetBrains\\Toolbox\\apps\\PyCharm-P\\*\\bin\\pycharm64.exe',
-                    'C:\\Program Files\\JetBrains\\PyCharm*\\bin\\pycharm64.exe',
-                    'C:\\Users\\{username}\\AppData\\Local\\JetBrains\\PyCharm*\\bin\\pycharm64.exe',
-                    'C:\\Program Files\\JetBrains\\PyCharm*\\bin\\pycharm.exe'
-                ],
-                'icon': '',
-                'url': 'https://www.jetbrains.com/pycharm/'
-            },
-            {
-                'name': 'IntelliJ IDEA',
-                'key': 'IntelliJ IDEA',
-                'description': 'Java IDE with multi-language support',
-                'commands': ['idea64', 'idea'],
-                'paths': [
-                    'C:\\Users\\{username}\\AppData\\Local\\JetBrains\\Toolbox\\apps\\IDEA-U\\*\\bin\\idea64.exe',
-                    'C:\\Program Files\\JetBrains\\IntelliJ IDEA*\\bin\\idea64.exe'
-                ],
-                'icon': '',
-                'url': 'https://www.jetbrains.com/idea/'
-            },
-            {
-                'name': 'RStudio',
-                'key': 'RStudio',
-                'description': 'IDE for R statistical computing and graphics',
-                'commands': ['rstudio'],
-                'paths': [
-                    'C:\\Program Files\\RStudio\\rstudio.exe',
-                    'C:\\Program Files\\RStudio\\bin\\rstudio.exe',
-                    'C:\\Users\\{username}\\AppData\\Local\\RStudio\\rstudio.exe'
-                ],
-                'icon': '',
-                'url': 'https://posit.co/download/rstudio-desktop/'
-            },
-            {
-                'name': 'Sublime Text',
-                'key': 'Sublime Text',
-                'description': 'Fast, lightweight text editor',
-                'commands': ['sublime_text', 'subl'],
-                'paths': [
-                    'C:\\Program Files\\Sublime Text*\\sublime_text.exe',
-                    'C:\\Users\\{username}\\AppData\\Local\\Sublime Text*\\sublime_text.exe'
-                ],
-                'icon': '📄',
-                'url': 'https://www.sublimetext.com/'
-            },
-            {
-                'name': 'Atom',
-                'key': 'Atom',
-                'description': 'Hackable text editor (deprecated)',
-                'commands': ['atom'],
-                'paths': [
-                    'C:\\Users\\{username}\\AppData\\Local\\atom\\atom.exe'
-                ],
-                'icon': '',
-                'url': 'https://atom.io/'
-            },
-            {
-                'name': 'Notepad++',
-                'key': 'Notepad++',
-                'description': 'Enhanced notepad with syntax highlighting',
-                'commands': ['notepad++'],
-                'paths': [
-                    'C:\\Program Files\\Notepad++\\notepad++.exe',
-                    'C:\\Program Files (x86)\\Notepad++\\notepad++.exe'
-                ],
-                'icon': '',
-                'url': 'https://notepad-plus-plus.org/'
-            },
-            {
-                'name': 'Eclipse',
-                'key': 'Eclipse',
-                'description': 'Java development environment',
-                'commands': ['eclipse'],
-                'paths': [
-                    'C:\\eclipse\\eclipse.exe',
-                    'C:\\Program Files\\Eclipse\\*\\eclipse.exe'
-                ],
-                'icon': '',
-                'url': 'https://www.eclipse.org/'
-            }
-        ]
-        
-        # Detect IDEs using both PATH commands and file system checks
-        import glob
-        username = os.getenv('USERNAME', 'User')
-        
-        statuses = {}
-        self.ide_vars = {}  # Store checkbox variables
-        
-        for idx, config in enumerate(ide_configs):
-            found = False
-            
-            # First try PATH-based detection
-            if any(shutil.which(cmd) for cmd in config['commands']):
-                found = True
-            
-            # If not found, try file system paths
-            if not found and 'paths' in config:
-                for pattern in config['paths']:
-                    # Replace username placeholder
-                    pattern = pattern.replace('{username}', username)
-                    try:
-                        # Use glob to handle wildcard patterns
-                        matches = glob.glob(pattern)
-                        if matches:
-                            found = True
-                            break
-                    except Exception:
-                        continue
-            
-            statuses[config['key']] = found
-            
-            # Create IDE cell in a 2-column grid to reduce height
-            row, col = divmod(idx, 2)
-            ide_row = ttk.Frame(grid_frame)
-            ide_row.grid(row=row, column=col, sticky="nsew", padx=(0, 6) if col == 0 else (6, 0), pady=2)
-            
-            # Checkbox for selection (default: enabled if detected)
-            self.ide_vars[config['key']] = tk.BooleanVar(value=found)
-            checkbox = ttk.Checkbutton(ide_row, variable=self.ide_vars[config['key']])
-            checkbox.pack(side="left", padx=(0, 8))
-            
-            # Left side: icon, name, and status
-            left_frame = ttk.Frame(ide_row)
-            left_frame.pack(side="left", fill="x", expand=True)
-            
-            if found:
-                status_text = f"{config['icon']} {config['name']}"
-                status_color = self.colors['success']
-                status_label = "✓ Detected"
-            else:
-                status_text = f"{config['icon']} {config['name']}"
-                status_color = self.colors['disabled']
-                status_label = "Not detected"
-            
-            # IDE name with icon
-            name_frame = ttk.Frame(left_frame)
-            name_frame.pack(anchor="w")
-            ttk.Label(name_frame, text=status_text, font=('Arial', 9, 'bold'), 
-                     foreground=status_color).pack(side="left")
-            ttk.Label(name_frame, text=f" - {status_label}", font=('Arial', 9), 
-                     foreground=status_color).pack(side="left")
-            
-            # Description - more compact
-            ttk.Label(left_frame, text=f"  {config['description']}", 
-                     font=('Arial', 8), foreground='gray').pack(anchor="w", padx=(20, 0))
-            
-            # Right side: Download button for not detected IDEs
-            if not found:
-                def open_url(url=config['url']):
-                    import webbrowser
-                    webbrowser.open(url)
-                
-                ttk.Button(ide_row, text="Download", 
-                          command=open_url).pack(side="right", padx=(6, 0))
+        # Rows come from the scan started at launch; draw them now if it is done
+        if self._ide_scan.done():
+            self._fill_ide_rows(self._ide_scan, grid_frame)
+        else:
+            ttk.Label(grid_frame, text="Scanning for installed IDEs...",
+                      style='Hint.TLabel').grid(row=0, column=0, columnspan=3, sticky="w")
+            # Indeterminate mode animates inside Tcl; no Python timer per frame
+            scan_bar = ttk.Progressbar(grid_frame, mode='indeterminate', length=80)
+            scan_bar.grid(row=0, column=3, columnspan=3, sticky="w", padx=(8, 0))
+            scan_bar.start(50)
+            self._when_done(self._ide_scan, self._fill_ide_rows, grid_frame)
         
         # Store IDE detection results and selections
         def collect():
+            # Never wait on the scan from the Tk thread: stay on the step until
+            # _fill_ide_rows has drawn the rows (Next is disabled until then)
+            if not self._ide_rows_ready:
+                return False
             # Store both detection status and user selection
+            statuses = self._ide_statuses()
             ide_data = {}
-            for key, var in self.ide_vars.items():
+            for key, detected in statuses.items():
+                var = self.ide_vars.get(key)
                 ide_data[key] = {
-                    'detected': statuses[key],
-                    'enabled': var.get()
+                    'detected': detected,
+                    'enabled': var.get() if var is not None else detected
                 }
             self.data["ide"] = ide_data
         
@@ -1075,19 +1701,76 @@ class WizardApp:
         ttk.Label(
             note_frame,
             text="ℹ IDE integration files will be created during final installation.",
-            font=('Arial', 8),
-            foreground='gray'
+            style='Hint.TLabel'
         ).pack(anchor="w")
 
         return f
 
+    def _ide_statuses(self) -> Dict[str, bool]:
+        """Result of the finished startup IDE scan; nothing detected if it failed.
+
+        Only called once the scan is done, so result() never blocks the Tk thread.
+        """
+        try:
+            return self._ide_scan.result()
+        except Exception:
+            return {config['key']: False for config in _IDE_CONFIGS}
+
+    def _fill_ide_rows(self, future: Future, grid_frame: ttk.Frame):
+        """Lay out one row pair per IDE once the scan has finished."""
+        try:
+            placeholders = grid_frame.winfo_children()
+        except tk.TclError:
+            # Step frame was rebuilt or the window closed while scanning
+            return
+        for child in placeholders:
+            if isinstance(child, ttk.Progressbar):
+                child.stop()
+        self._destroy_widgets(*placeholders)
+        statuses = self._ide_statuses()
+        self.ide_vars = {}  # Store checkbox variables
+        
+        for idx, config in enumerate(_IDE_CONFIGS):
+            found = statuses[config['key']]
+            
+            # Lay each IDE directly on the shared grid: two rows, three cells
+            pair, half = divmod(idx, 2)
+            row, col = pair * 2, half * 3
+            
+            # Checkbox for selection (default: enabled if detected)
+            self.ide_vars[config['key']] = tk.BooleanVar(value=found)
+            ttk.Checkbutton(grid_frame, variable=self.ide_vars[config['key']]).grid(
+                row=row, column=col, rowspan=2, sticky="nw", padx=(12 if half else 0, 8), pady=(2, 0))
+            
+            status_color = self.colors['success'] if found else self.colors['disabled']
+            status_label = "✓ Detected" if found else "Not detected"
+            
+            # IDE name with icon and detection status
+            ttk.Label(grid_frame, text=f"{config['icon']} {config['name']} - {status_label}",
+                     font='WizardBodyBold', foreground=status_color).grid(
+                         row=row, column=col + 1, sticky="w", pady=(2, 0))
+            
+            # Description - more compact
+            ttk.Label(grid_frame, text=f"  {config['description']}", 
+                     style='Hint.TLabel').grid(
+                         row=row + 1, column=col + 1, sticky="w", padx=(20, 0), pady=(0, 2))
+            
+            # Right side: Download button for not detected IDEs
+            if not found:
+                ttk.Button(grid_frame, text="Download", 
+                          command=lambda url=config['url']: webbrowser.open(url)).grid(
+                              row=row, column=col + 2, rowspan=2, sticky="e", padx=(6, 0))
+
+        self._ide_rows_ready = True
+        self._schedule_nav_state()
+
     def _step_copilot(self):
         """GitHub Copilot integration configuration."""
         f = ttk.Frame(self.body)
         
         # Compact header
         ttk.Label(f, text="Configure AI-powered code assistance and intelligent automation.", 
-                 font=('Arial', 9), foreground="gray").pack(anchor="w", pady=(0, 10))
+                 style='Intro.TLabel').pack(anchor="w", pady=(0, 10))
         
         # Two-column layout
         columns_container = ttk.Frame(f)
@@ -1098,22 +1781,21 @@ class WizardApp:
         left_column.pack(side="left", fill="both", expand=True, padx=(0, 6))
         
         # Copilot detection status
-        has_vscode = self.data["ide"].get("VS Code", False)
-        copilot_detected = has_vscode and shutil.which("code") is not None
+        # Keyed lookup of the VS Code entry; the entry itself is a dict, so test its flag
+        has_vscode = _ide_enabled(self.data["ide"].get("VS Code"))
+        copilot_detected = has_vscode and _which("code") is not None
         
-        detection_frame = ttk.LabelFrame(left_column, text="🔍 IDE Detection", padding=10)
-        detection_frame.pack(fill="x", pady=(0, 8))
+        detection_frame = self._section(left_column, "🔍 IDE Detection", fill="x", pady=(0, 8))
         
         if copilot_detected:
             ttk.Label(detection_frame, text="✓ VS Code detected - Copilot integration available", 
-                     font=('Arial', 9), foreground=self.colors['success']).pack(anchor="w")
+                     font='WizardBody', foreground=self.colors['success']).pack(anchor="w")
         else:
             ttk.Label(detection_frame, text=" VS Code not detected - Install for full integration", 
-                     font=('Arial', 9), foreground=self.colors['warning']).pack(anchor="w")
+                     font='WizardBody', foreground=self.colors['warning']).pack(anchor="w")
         
         # Integration options
-        options_frame = ttk.LabelFrame(left_column, text="⚙️ Integration Options", padding=10)
-        options_frame.pack(fill="both", expand=True)
+        options_frame = self._section(left_column, "⚙️ Integration Options", fill="both", expand=True)
         
         self.copilot_enabled = tk.BooleanVar(value=self.data["copilot"]["enabled"])
         self.copilot_vscode_ext = tk.BooleanVar(value=self.data["copilot"]["install_vscode_extension"])
@@ -1145,35 +1827,17 @@ class WizardApp:
         right_column.pack(side="left", fill="both", expand=True, padx=(6, 0))
         
         # Benefits section
-        benefits_frame = ttk.LabelFrame(right_column, text="✨ What You Get", padding=10)
-        benefits_frame.pack(fill="both", expand=True, pady=(0, 8))
-        
-        benefits = [
-            "🔍 AI-powered code review",
-            "🤖 Intelligent audit remediation",
-            " Context-aware code generation",
-            " Security-first automation",
-            " Smart analysis with remediation",
-            " Automated cleanup"
-        ]
+        benefits_frame = self._section(right_column, "✨ What You Get", fill="both", expand=True, pady=(0, 8))
         
-        for benefit in benefits:
-            ttk.Label(benefits_frame, text=benefit, font=('Arial', 9), 
-                     foreground="#424242").pack(anchor="w", pady=2)
+        # One multi-line label instead of a widget per line
+        ttk.Label(benefits_frame, text=_COPILOT_BENEFITS_TEXT, font='WizardBody',
+                 justify="left", foreground="#424242").pack(anchor="w", pady=2)
         
         # Installation notes
-        note_frame = ttk.LabelFrame(right_column, text="ℹ Installation Notes", padding=10)
-        note_frame.pack(fill="x")
+        note_frame = self._section(right_column, "ℹ Installation Notes", fill="x")
         
-        notes = [
-            "• Extension installs via code command",
-            "• Instructions at .github/copilot-instructions.md",
-            "• GitHub Copilot from VS Code marketplace"
-        ]
-        
-        for note in notes:
-            ttk.Label(note_frame, text=note, font=('Arial', 8), 
-                     foreground="gray").pack(anchor="w", pady=1)
+        ttk.Label(note_frame, text=_COPILOT_NOTES_TEXT, style='Hint.TLabel',
+                 justify="left").pack(anchor="w", pady=1)
         
         self._toggle_copilot_options()
         
@@ -1191,7 +1855,7 @@ class WizardApp:
     def _toggle_copilot_options(self):
         """Enable/disable sub-options based on main checkbox."""
         state = "normal" if self.copilot_enabled.get() else "disabled"
-        for child in self.copilot_sub_frame.winfo_children():
+        for child in self.copilot_sub_frame.children.values():
             if isinstance(child, ttk.Checkbutton):
                 child.configure(state=state)
 
@@ -1200,7 +1864,7 @@ class WizardApp:
         
         # Compact header
         ttk.Label(f, text="Configure additional automation features that enhance security and workflow.", 
-                 font=('Arial', 9), foreground="gray").pack(anchor="w", pady=(0, 10))
+                 style='Intro.TLabel').pack(anchor="w", pady=(0, 10))
         
         # Initialize variables
         self.opt_scheduler = tk.BooleanVar(value=self.data["optional"]["scheduler"]) 
@@ -1208,8 +1872,7 @@ class WizardApp:
         self.opt_ci = tk.BooleanVar(value=self.data["optional"]["ci"])
         
         # Features frame
-        features_frame = ttk.LabelFrame(f, text=" Automation & Integration Features", padding=10)
-        features_frame.pack(fill="both", expand=True, pady=(0, 8))
+        features_frame = self._section(f, " Automation & Integration Features", fill="both", expand=True, pady=(0, 8))
         
         # Feature 1: Scheduled Maintenance
         self._create_optional_feature(
@@ -1260,23 +1923,19 @@ class WizardApp:
         )
         
         # Recommendations section
-        recommendations_frame = ttk.LabelFrame(f, text=" Smart Recommendations", padding=10)
-        recommendations_frame.pack(fill="x")
+        recommendations_frame = self._section(f, " Smart Recommendations", fill="x")
         
         # Generate context-aware recommendations
         recommendations = []
-        try:
-            if (Path.cwd() / ".git").exists():
-                recommendations.append("Git Hooks highly recommended for your Git repository")
-            if self.data.get("github", {}).get("enabled", False):
-                recommendations.append("CI/CD templates complement your GitHub integration")
-            if not recommendations:
-                recommendations.append("Git Hooks provide immediate value with minimal setup")
-        except:
-            recommendations.append("Review each feature to choose what fits your workflow")
+        if self._cwd_is_git:
+            recommendations.append("Git Hooks highly recommended for your Git repository")
+        if self.data["github"].get("enabled", False):
+            recommendations.append("CI/CD templates complement your GitHub integration")
+        if not recommendations:
+            recommendations.append("Git Hooks provide immediate value with minimal setup")
         
         rec_text = "Based on your configuration:\n" + "\n".join(f"• {rec}" for rec in recommendations)
-        ttk.Label(recommendations_frame, text=rec_text, font=('Arial', 9), 
+        ttk.Label(recommendations_frame, text=rec_text, font='WizardBody', 
                  justify="left", foreground="#424242").pack(anchor="w")
 
         def collect():
@@ -1307,18 +1966,15 @@ class WizardApp:
         badge_frame = ttk.Frame(header_frame)
         badge_frame.pack(side="right")
         
-        complexity_colors = {'Beginner': self.colors['success'], 
-                            'Intermediate': self.colors['warning'], 
-                            'Advanced': self.colors['error']}
-        
-        ttk.Label(badge_frame, text=f" {complexity}", font=('Arial', 8), 
-                 foreground=complexity_colors.get(complexity, 'black')).pack(side="right", padx=(8, 0))
+        color_key = _COMPLEXITY_COLOR_KEYS.get(complexity)
+        ttk.Label(badge_frame, text=f" {complexity}", font='WizardSmall', 
+                 foreground=self.colors[color_key] if color_key else 'black').pack(side="right", padx=(8, 0))
         
-        ttk.Label(badge_frame, text=f" {impact}", font=('Arial', 8), 
+        ttk.Label(badge_frame, text=f" {impact}", font='WizardSmall', 
                  foreground="#424242").pack(side="right", padx=(8, 0))
         
         # Subtitle
-        ttk.Label(feature_frame, text=subtitle, font=('Arial', 9, 'italic'), 
+        ttk.Label(feature_frame, text=subtitle, font='WizardBodyItalic', 
                  foreground="gray").pack(anchor="w", pady=(1, 3), padx=(20, 0))
         
         # Description (collapsible)
@@ -1326,12 +1982,15 @@ class WizardApp:
         desc_frame.pack(fill="x", padx=(20, 0))
         
         desc_var = tk.BooleanVar(value=False)
-        desc_label = ttk.Label(desc_frame, text=description, font=('Arial', 8), 
-                              justify="left", foreground='#333333')
+        desc_label = None  # built on first expand; most users never open details
         
         def toggle_description():
+            nonlocal desc_label
             desc_var.set(not desc_var.get())
             if desc_var.get():
+                if desc_label is None:
+                    desc_label = ttk.Label(desc_frame, text=description, font='WizardSmall', 
+                                          justify="left", foreground='#333333')
                 desc_label.pack(fill="x", pady=(3, 3))
                 toggle_btn.config(text="ℹ Hide Details")
             else:
@@ -1351,7 +2010,7 @@ class WizardApp:
         
         # Compact header
         ttk.Label(f, text="Configure document formatting rules for consistent code style and documentation.", 
-                 font=('Arial', 9), foreground="gray").pack(anchor="w", pady=(0, 10))
+                 style='Intro.TLabel').pack(anchor="w", pady=(0, 10))
         
         # Import formatting GUI components
         from .gui.formatting_config import FormattingSchemeSelector, FormattingCustomizationPanel
@@ -1369,11 +2028,10 @@ class WizardApp:
         content_frame.pack(fill="both", expand=True, pady=(0, 10))
         
         # Left column: Style Convention Selection
-        left_frame = ttk.LabelFrame(content_frame, text="Step 1: Select Style Convention", padding=10)
-        left_frame.pack(side=tk.LEFT, fill="both", expand=True, padx=(0, 10))
+        left_frame = self._section(content_frame, "Step 1: Select Style Convention", side=tk.LEFT, fill="both", expand=True, padx=(0, 10))
         
         ttk.Label(left_frame, text="Choose a formatting scheme:", 
-                 font=('Arial', 9)).pack(anchor="w", pady=(0, 8))
+                 font='WizardBody').pack(anchor="w", pady=(0, 8))
         
         # Scheme selector - compact version
         self.formatting_scheme_selector = FormattingSchemeSelector(left_frame, compact=True)
@@ -1384,11 +2042,10 @@ class WizardApp:
         self.formatting_scheme_selector.current_scheme.set(default_scheme)
         
         # Right column: Custom Configuration
-        right_frame = ttk.LabelFrame(content_frame, text="Step 2: Configure Options", padding=10)
-        right_frame.pack(side=tk.LEFT, fill="both", expand=True, padx=(10, 0))
+        right_frame = self._section(content_frame, "Step 2: Configure Options", side=tk.LEFT, fill="both", expand=True, padx=(10, 0))
         
         ttk.Label(right_frame, text="Fine-tune formatting:", 
-                 font=('Arial', 9)).pack(anchor="w", pady=(0, 8))
+                 font='WizardBody').pack(anchor="w", pady=(0, 8))
         
         # Custom configuration panel
         self.formatting_custom_panel = FormattingCustomizationPanel(right_frame)
@@ -1415,8 +2072,7 @@ class WizardApp:
         ttk.Label(
             enable_frame,
             text="When enabled, document formatting checks run automatically during scheduled maintenance.",
-            font=('Arial', 8),
-            foreground="gray"
+            style='Hint.TLabel'
         ).pack(anchor="w", padx=(20, 0), pady=(2, 0))
         
         def collect():
@@ -1435,7 +2091,7 @@ class WizardApp:
         
         # Header
         ttk.Label(f, text="Review your configuration, then click Finish to save.", 
-                 font=('Arial', 9), foreground="gray").pack(anchor="w", pady=(0, 10))
+                 style='Intro.TLabel').pack(anchor="w", pady=(0, 10))
         
         # Summary display in a styled Text widget with scrollbar
         text_frame = ttk.Frame(f)
@@ -1447,7 +2103,7 @@ class WizardApp:
         
         self.summary_text = tk.Text(text_frame, 
                                     wrap="word",
-                                    font=('Consolas', 9),
+                                    font='WizardCode',
                                     bg="#f5f5f5",
                                     relief="solid",
                                     borderwidth=1,
@@ -1469,33 +2125,12 @@ class WizardApp:
         
         # Caption above thumbnail
         ttk.Label(venture_container, text="a Polymath venture", 
-                 font=('Arial', 8, 'italic'), foreground="#666666").pack(anchor="center", pady=(0, 2))
+                 font='WizardSmallItalic', foreground="#666666").pack(anchor="center", pady=(0, 2))
         
-        # Thumbnail (scaled down)
-        try:
-            from pathlib import Path as _P
-            _here = _P(__file__).resolve().parent
-            candidate_paths = [
-                _here / "assets" / "polymath.png",
-                _here.parent / "docs" / "polymath.png",
-            ]
-            self._polymath_img = None
-            for _p in candidate_paths:
-                if _p.exists():
-                    full_img = tk.PhotoImage(file=str(_p))
-                    target_w, target_h = 50, 40
-                    # Determine scaling factor to keep aspect ratio within target bounds
-                    width_factor = max(1, (full_img.width() + target_w - 1) // target_w)
-                    height_factor = max(1, (full_img.height() + target_h - 1) // target_h)
-                    scale = max(width_factor, height_factor)
-                    self._polymath_img = full_img.subsample(scale, scale)  # type: ignore
-                    break
-            if self._polymath_img is not None:
-                img_label = ttk.Label(venture_container, image=self._polymath_img)
-                img_label.pack(anchor="center")
-        except Exception:
-            # Image optional; proceed without it
-            self._polymath_img = None
+        # Thumbnail (scaled down, decoded once per wizard)
+        thumbnail = self._polymath_thumbnail()
+        if thumbnail is not None:
+            ttk.Label(venture_container, image=thumbnail).pack(anchor="center")
 
         def collect():
             """Generate formatted summary of configuration."""
@@ -1567,14 +2202,7 @@ class WizardApp:
                 summary.append(" IDE INTEGRATION")
                 summary.append("   ")
                 ide_data = self.data.get('ide', {})
-                enabled_ides = []
-                for ide, data in ide_data.items():
-                    # Check if it's the new format (dict with 'enabled' key) or old format (boolean)
-                    if isinstance(data, dict):
-                        if data.get('enabled', False):
-                            enabled_ides.append(ide)
-                    elif data:  # Old format: direct boolean
-                        enabled_ides.append(ide)
+                enabled_ides = [ide for ide, entry in ide_data.items() if _ide_enabled(entry)]
                 
                 if enabled_ides:
                     for ide in enabled_ides:
@@ -1650,15 +2278,16 @@ class WizardApp:
             Path.home() / "Documents",
             Path.home() / "Projects",
             Path.home() / "Code",
-            Path.cwd().parent,
-            Path.cwd(),
+            self._cwd.parent,
+            self._cwd,
         }
         found: List[Path] = []
-        queue: List[Tuple[Path, int]] = [(p, 0) for p in roots if p.exists()]
+        # BFS carries the depth with each entry, so no path parsing is needed
+        pending: deque[Tuple[Path, int]] = deque((p, 0) for p in roots if p.exists())
         max_depth, max_count = 3, 10
         seen = set()
-        while queue and len(found) < max_count:
-            base, depth = queue.pop(0)
+        while pending and len(found) < max_count:
+            base, depth = pending.popleft()
             if base in seen:
                 continue
             seen.add(base)
@@ -1670,20 +2299,59 @@ class WizardApp:
                             if len(found) >= max_count:
                                 break
                         if depth < max_depth:
-                            queue.append((child, depth + 1))
+                            pending.append((child, depth + 1))
             except (PermissionError, OSError):
                 continue
         return found
 
-    def _use_selected_repo(self):
+    def _show_detected_repos(self, future: Future, parent: ttk.Frame):
+        """Fill the location step's repository list once the background scan finishes."""
         try:
-            sel = self.repo_list.curselection()
-            if sel:
-                self.loc_var.set(self.repo_list.get(sel[0]))
+            detected_repos = future.result()
         except Exception:
-            pass
+            detected_repos = []
+        if not detected_repos or not parent.winfo_exists():
+            return
+        ttk.Label(parent, text="Detected Git Repositories:", 
+                 font='WizardBodyBold').pack(anchor="w", pady=(8, 4))
+        
+        # One Treeview holds every repo; selecting a row uses it as the location
+        self.repo_tree = ttk.Treeview(parent, columns=("path",), show="tree headings",
+                                      height=min(len(detected_repos), 8), selectmode="browse")
+        self.repo_tree.heading("#0", text="Repository", anchor="w")
+        self.repo_tree.heading("path", text="Location", anchor="w")
+        self.repo_tree.column("#0", width=140, stretch=False)
+        self.repo_tree.pack(fill="both", expand=True, pady=(0, 6))
+        cwd_s, home_s = str(self._cwd), str(Path.home())
+        for p in detected_repos:
+            self.repo_tree.insert("", "end", iid=str(p), text=p.name,
+                                  values=(_relative_path_display(p, cwd_s, home_s),))
+        self.repo_tree.bind("<<TreeviewSelect>>", self._use_selected_repo)
+
+    def _use_selected_repo(self, event=None):
+        # Row iids are the full repository paths
+        sel = self.repo_tree.selection()
+        if sel:
+            self.loc_var.set(sel[0])
 
     def _save_and_finish(self):
+        # Saving blocks the Tk thread (git init, extension install); disable the
+        # buttons and flush only the redraw so a second click is not taken
+        self.next_btn.config(state="disabled", text="Finishing...")
+        self.back_btn.state(["disabled"])
+        self.root.update_idletasks()
+        try:
+            target = self._save_configuration()
+        except Exception:
+            self.back_btn.state(["!disabled"])
+            self._update_nav_state()
+            raise
+        
+        messagebox.showinfo("Setup Complete", f"Configuration saved to: {target}")
+        self.root.destroy()
+
+    def _save_configuration(self) -> Path:
+        """Write codesentinel.json and apply the chosen integrations; returns the config path."""
         # Save configuration to selected location
         target = Path(self.data["install_location"]) / "codesentinel.json"
         cm = ConfigManager(config_path=target)
@@ -1695,8 +2363,7 @@ class WizardApp:
         if self.data.get("github", {}).get("mode") == "initialize":
             if not (install_path / ".git").exists():
                 try:
-                    import subprocess
-                    subprocess.run(["git", "init"], cwd=str(install_path), capture_output=True)
+                    _run_git("init", cwd=install_path, capture=False)
                 except Exception:
                     pass
         
@@ -1704,14 +2371,10 @@ class WizardApp:
         copilot_config = self.data.get("copilot", {})
         if copilot_config.get("enabled", False):
             self._install_copilot_integration(install_path, copilot_config)
-        
-        messagebox.showinfo("Setup Complete", f"Configuration saved to: {target}")
-        self.root.destroy()
+        return target
 
     def _install_copilot_integration(self, install_path: Path, config: Dict[str, Any]):
         """Install Copilot integration components."""
-        import subprocess
-        
         results = []
         
         # Generate Copilot instructions
@@ -1726,7 +2389,7 @@ class WizardApp:
         if config.get("install_vscode_extension", False):
             try:
                 # Check if 'code' command is available
-                if shutil.which("code"):
+                if _which("code"):
                     # For now, just create a VS Code settings file with CodeSentinel config
                     # In the future, we can create an actual extension
                     vscode_dir = install_path / ".vscode"
@@ -1745,16 +2408,17 @@ class WizardApp:
                         }
                     }
                     
-                    import json
+                    existing = None
                     if settings_file.exists():
                         # Merge with existing settings
                         with open(settings_file, 'r') as f:
                             existing = json.load(f)
-                        existing.update(settings)
-                        settings = existing
+                        settings = {**existing, **settings}
                     
-                    with open(settings_file, 'w') as f:
-                        json.dump(settings, f, indent=2)
+                    # Only rewrite when the merge actually changes something
+                    if settings != existing:
+                        with open(settings_file, 'w') as f:
+                            json.dump(settings, f, indent=2)
                     
                     results.append("✓ Created .vscode/settings.json with CodeSentinel config")
                 else:
@@ -1773,137 +2437,22 @@ class WizardApp:
         
         instructions_file = github_dir / "copilot-instructions.md"
         
-        instructions_content = """# CodeSentinel AI Agent Instructions
-
-CodeSentinel is a security-first automated maintenance and monitoring system with SEAM Protection™:
-**Security, Efficiency, And Minimalism** (with Security taking absolute priority).
-
-## Architecture Overview
-
-The codebase follows a dual-architecture pattern:
-
-- **`codesentinel/`** - Core Python package with CLI interface (`codesentinel`, `codesentinel-setup`)
-- **`tools/codesentinel/`** - Comprehensive maintenance automation scripts
-- **`tools/config/`** - JSON configuration files for alerts, scheduling, and policies
-- **`tests/`** - Test suite using pytest with unittest fallback
-
-## Key Commands
-
-### Development Audit
-```bash
-# Run interactive audit
-codesentinel !!!!
-
-# Get agent-friendly context for remediation
-codesentinel !!!! --agent
-```
-
-### Maintenance Operations
-```bash
-# Daily maintenance workflow
-python tools/codesentinel/scheduler.py --schedule daily
-
-# Weekly maintenance (security, dependencies, performance)
-python tools/codesentinel/scheduler.py --schedule weekly
-```
-
-## Core Principles
-
-### SECURITY
-- No hardcoded credentials - Environment variables or config files only
-- Audit logging - All operations logged with timestamps
-- Configuration validation - Auto-creation of missing configs with secure defaults
-- Dependency scanning - Automated vulnerability detection
-
-### EFFICIENCY
-- Avoid redundant code and duplicate implementations
-- Consolidate multiple versions of similar functionality
-- Clean up orphaned test files and unused scripts
-- Optimize import structures and module organization
-
-### MINIMALISM
-- Remove unnecessary dependencies
-- Archive deprecated code to quarantine_legacy_archive/
-- Maintain single source of truth for each feature
-- Keep codebase focused and maintainable
-
-## Persistent Policies
-
-When working with this codebase:
-
-1. **NON-DESTRUCTIVE**: Never delete code without archiving first
-2. **FEATURE PRESERVATION**: All existing functionality must be maintained
-3. **STYLE PRESERVATION**: Respect existing code style and patterns
-4. **SECURITY FIRST**: Security concerns always take priority
-
-## Agent-Driven Remediation
-
-When `codesentinel !!!! --agent` is run, you will receive comprehensive audit context with:
-
-- Detected issues (security, efficiency, minimalism)
-- Remediation hints with priority levels
-- Safe-to-automate vs. requires-review flags
-- Step-by-step suggested actions
-
-Your role is to:
-
-1. **ANALYZE**: Review each issue with full context
-2. **PRIORITIZE**: Focus on critical/high priority items first  
-3. **DECIDE**: Determine safe vs. requires-review actions
-4. **PLAN**: Build step-by-step remediation plan
-5. **EXECUTE**: Only perform safe, non-destructive operations
-6. **REPORT**: Document all actions and decisions
-
-## Safe Actions (can automate)
-
-- Moving test files to proper directories
-- Adding entries to .gitignore
-- Removing __pycache__ directories
-- Archiving confirmed-redundant files to quarantine_legacy_archive/
-
-## Requires Review (agent decision needed)
-
-- Deleting or archiving potentially-used code
-- Consolidating multiple implementations
-- Removing packaging configurations
-- Modifying imports or entry points
-
-## Forbidden Actions
-
-- Deleting files without archiving
-- Forcing code style changes
-- Removing features without verification
-- Modifying core functionality without explicit approval
-
-## Integration Points
-
-### GitHub Integration
-- Repository-aware configuration detection
-- Copilot instructions generation (this file)
-- PR review automation capabilities
-
-### Multi-Platform Support  
-- Python 3.13/3.14 requirement with backward compatibility
-- Cross-platform paths using `pathlib.Path` consistently
-- PowerShell/Python dual execution support for Windows/Unix
-
-## When Modifying This Codebase
-
-1. **Understand the dual architecture** - Core package vs. tools scripts serve different purposes
-2. **Maintain execution order** - Change detection dependency is critical
-3. **Preserve configuration structure** - JSON configs have specific schemas
-4. **Test both execution paths** - pytest and unittest must both work
-5. **Follow security-first principle** - Never compromise security for convenience
-6. **Update timeout values carefully** - Task timeouts affect workflow reliability
-"""
-        
+        # Leave an identical file untouched (no mtime churn for watchers or git)
+        try:
+            if instructions_file.read_text(encoding='utf-8') == _COPILOT_INSTRUCTIONS:
+                return
+        except (OSError, UnicodeDecodeError):
+            pass
         with open(instructions_file, 'w', encoding='utf-8') as f:
-            f.write(instructions_content)
+            f.write(_COPILOT_INSTRUCTIONS)
 
 
 def main():
     app = WizardApp()
-    app.root.mainloop()
+    try:
+        app.root.mainloop()
+    finally:
+        app._io_pool.shutdown(wait=False)
 
 
 if __name__ == "__main__":
@@ -5,15 +5,17 @@ Alert Management System
 Handles sending alerts through various channels (email, Slack, console, file).
 """
 
+import atexit
+import hashlib
 import json
 import os
+import re
 import smtplib
 import logging
+import threading
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
-from urllib.parse import urlparse
 
 try:
     import requests
@@ -21,6 +23,29 @@ except ImportError:
     requests = None
 
 
+# Seconds before an SMTP connect or command gives up, so a dead server cannot hang a sender
+_SMTP_TIMEOUT = 20
+
+# HTTPS only, host hooks.slack.com or another *.slack.com name, path containing /services/
+_SLACK_WEBHOOK_RE = re.compile(
+    r'\Ahttps://(?:[a-z0-9-]+\.)+slack\.com(?::\d+)?/(?:[^?#]*/)?services/',
+    re.IGNORECASE,
+)
+
+
+def is_valid_slack_webhook(url: str) -> bool:
+    """
+    Allowlist check for Slack webhook URLs, used to prevent SSRF.
+
+    Args:
+        url: Webhook URL to check.
+
+    Returns:
+        True if the URL is an HTTPS Slack webhook.
+    """
+    return bool(url) and _SLACK_WEBHOOK_RE.match(url) is not None
+
+
 class AlertManager:
     """Manages alert notifications across multiple channels."""
 
@@ -33,6 +58,67 @@ class AlertManager:
         """
         self.config_manager = config_manager
         self.logger = logging.getLogger('AlertManager')
+        # Authenticated SMTP sessions keyed by (server, port, username), stored
+        # with a digest of the password they logged in with
+        self._smtp_cache: Dict[Tuple[str, int, str], Tuple[str, smtplib.SMTP]] = {}
+        # Sessions are shared by the scheduler and background audit threads;
+        # held across get + send so one socket never carries two conversations
+        self._smtp_lock = threading.RLock()
+        self._close_registered = False
+
+    def _get_smtp(self, smtp_server: str, smtp_port: int, username: str, password: str) -> smtplib.SMTP:
+        """
+        Return an authenticated SMTP session, reusing a cached one if still alive.
+
+        A cached session is reused only if it logged in with the same password
+        and still answers NOOP; otherwise a fresh connect/STARTTLS/login is
+        performed and cached instead. Callers hold ``_smtp_lock``.
+        """
+        key = (smtp_server, smtp_port, username)
+        digest = hashlib.sha256(password.encode('utf-8')).hexdigest()
+        cached = self._smtp_cache.get(key)
+        if cached is not None:
+            cached_digest, server = cached
+            if cached_digest == digest:
+                try:
+                    if server.noop()[0] == 250:
+                        return server
+                except (smtplib.SMTPException, OSError):
+                    pass
+            self._discard_smtp(key)
+
+        server = smtplib.SMTP(smtp_server, smtp_port, timeout=_SMTP_TIMEOUT)
+        try:
+            server.starttls()
+            server.login(username, password)
+        except Exception:
+            server.close()
+            raise
+        self._smtp_cache[key] = (digest, server)
+        if not self._close_registered:
+            atexit.register(self.close)
+            self._close_registered = True
+        return server
+
+    def _discard_smtp(self, key: Tuple[str, int, str]):
+        """Drop a cached SMTP session without raising."""
+        with self._smtp_lock:
+            cached = self._smtp_cache.pop(key, None)
+            if cached is not None:
+                try:
+                    cached[1].close()
+                except OSError:
+                    pass
+
+    def close(self):
+        """Close any cached SMTP sessions."""
+        with self._smtp_lock:
+            for _digest, server in self._smtp_cache.values():
+                try:
+                    server.quit()
+                except (smtplib.SMTPException, OSError):
+                    server.close()
+            self._smtp_cache.clear()
 
     def send_alert(self, title: str, message: str, severity: str = 'info',
                    channels: Optional[List[str]] = None):
@@ -77,20 +163,7 @@ class AlertManager:
 
         Accept only HTTPS webhooks to Slack domains.
         """
-        try:
-            parsed = urlparse(url)
-            if parsed.scheme != "https":
-                return False
-            # Typical Slack webhook hosts are hooks.slack.com (and regional variants)
-            host = (parsed.hostname or "").lower()
-            if not host:
-                return False
-            if not (host == "hooks.slack.com" or host.endswith(".slack.com")):
-                return False
-            # Path should include /services/
-            return "/services/" in parsed.path
-        except Exception:
-            return False
+        return is_valid_slack_webhook(url)
 
     def _send_console_alert(self, title: str, message: str, severity: str) -> bool:
         """Send alert to console."""
@@ -132,17 +205,15 @@ class AlertManager:
             return False
 
         try:
-            # Create message
-            msg = MIMEMultipart()
+            # Plain-text alert: a single MIMEText part, no multipart container
+            body = f"Severity: {severity.upper()}\n\n{message}"
+            msg = MIMEText(body, 'plain')
             from_email = config.get('from_email', config.get('username', os.getenv('CODESENTINEL_EMAIL_USERNAME', '')))
             to_emails = config.get('to_emails', [])
             msg['From'] = from_email
             msg['To'] = ', '.join(to_emails)
             msg['Subject'] = f"[CodeSentinel] {severity.upper()}: {title}"
 
-            body = f"Severity: {severity.upper()}\n\n{message}"
-            msg.attach(MIMEText(body, 'plain'))
-
             # Send email
             smtp_server = config.get('smtp_server')
             smtp_port = config.get('smtp_port', 587)
@@ -157,11 +228,14 @@ class AlertManager:
             username = str(username)
             password = str(password)
 
-            server = smtplib.SMTP(smtp_server, smtp_port)
-            server.starttls()
-            server.login(username, password)
-            server.send_message(msg)
-            server.quit()
+            with self._smtp_lock:
+                server = self._get_smtp(smtp_server, smtp_port, username, password)
+                try:
+                    server.send_message(msg)
+                except (smtplib.SMTPServerDisconnected, OSError):
+                    # Connection died between the liveness probe and the send
+                    self._discard_smtp((smtp_server, smtp_port, username))
+                    raise
 
             return True
 
@@ -243,7 +317,14 @@ class AlertManager:
         return result
 
     def _test_email_config(self) -> bool:
-        """Test email configuration."""
+        """
+        Test email configuration.
+
+        The session opened by the test is deliberately left in the SMTP
+        cache rather than closed: the next alert reuses it instead of
+        logging in again. It is closed by ``close()`` (registered with
+        atexit), or discarded once it stops answering NOOP.
+        """
         config = self.config_manager.get('alerts.channels.email', {})
 
         try:
@@ -255,10 +336,8 @@ class AlertManager:
                 return False
             username = str(username)
             password = str(password)
-            server = smtplib.SMTP(smtp_server, smtp_port)
-            server.starttls()
-            server.login(username, password)
-            server.quit()
+            with self._smtp_lock:
+                self._get_smtp(smtp_server, smtp_port, username, password)
             return True
         except Exception:
             return False
@@ -0,0 +1,17 @@
+"""
+Display Detection
+=================
+
+Shared headless check for the Tk wizards, so they fail fast instead of
+hanging or raising deep inside Tk when no display is available.
+"""
+
+import os
+import sys
+
+
+def display_available() -> bool:
+    """Return False on Linux when neither an X11 nor a Wayland display is set."""
+    if sys.platform.startswith('linux'):
+        return bool(os.environ.get('DISPLAY') or os.environ.get('WAYLAND_DISPLAY'))
+    return True
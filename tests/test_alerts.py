@@ -0,0 +1,137 @@
+"""Tests for the CodeSentinel alert manager."""
+
+import os
+import smtplib
+import sys
+import threading
+import time
+import unittest
+from unittest import mock
+
+# Add the codesentinel package to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from codesentinel.utils import alerts
+from codesentinel.utils.alerts import AlertManager, is_valid_slack_webhook
+
+
+class _StubConfig:
+    """Minimal config manager returning fixed dotted-key values."""
+
+    def __init__(self, values):
+        self.values = values
+
+    def get(self, key, default=None):
+        return self.values.get(key, default)
+
+
+EMAIL_CONFIG = {
+    'enabled': True,
+    'smtp_server': 'smtp.example.com',
+    'smtp_port': 587,
+    'username': 'bot@example.com',
+    'password': 'secret',
+    'from_email': 'bot@example.com',
+    'to_emails': ['ops@example.com'],
+}
+
+
+class TestEmailSessionReuse(unittest.TestCase):
+    """Test cases for SMTP session caching."""
+
+    def setUp(self):
+        """Set up an alert manager with email configured."""
+        self.manager = AlertManager(_StubConfig({'alerts.channels.email': EMAIL_CONFIG}))
+        patcher = mock.patch('codesentinel.utils.alerts.smtplib.SMTP')
+        self.smtp_cls = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.smtp_cls.return_value.noop.return_value = (250, b'OK')
+
+    def test_test_then_send_authenticates_once(self):
+        """A config test followed by alerts reuses the authenticated session."""
+        self.assertTrue(self.manager._test_email_config())
+        self.assertTrue(self.manager._send_email_alert('t', 'm', 'info'))
+        self.assertTrue(self.manager._send_email_alert('t', 'm', 'info'))
+        self.smtp_cls.assert_called_once_with('smtp.example.com', 587, timeout=alerts._SMTP_TIMEOUT)
+        self.smtp_cls.return_value.login.assert_called_once()
+        self.assertEqual(self.smtp_cls.return_value.send_message.call_count, 2)
+
+    def test_alert_is_single_plain_text_part(self):
+        """Alerts are sent as one text/plain message with the expected headers."""
+        self.manager._send_email_alert('Disk full', 'Only 1% left', 'warning')
+        msg = self.smtp_cls.return_value.send_message.call_args[0][0]
+        self.assertFalse(msg.is_multipart())
+        self.assertEqual(msg.get_content_type(), 'text/plain')
+        self.assertEqual(msg['Subject'], '[CodeSentinel] WARNING: Disk full')
+        self.assertIn('Only 1% left', msg.get_payload(decode=True).decode())
+
+    def test_dead_session_reconnects(self):
+        """A session that fails NOOP is replaced by a fresh login."""
+        self.manager._test_email_config()
+        self.smtp_cls.return_value.noop.side_effect = OSError('gone')
+        self.assertTrue(self.manager._send_email_alert('t', 'm', 'info'))
+        self.assertEqual(self.smtp_cls.call_count, 2)
+
+    def test_changed_password_logs_in_again(self):
+        """A cached session is not reused once the configured password changes."""
+        self.assertTrue(self.manager._test_email_config())
+        self.manager.config_manager.values['alerts.channels.email'] = dict(EMAIL_CONFIG, password='wrong')
+        self.smtp_cls.return_value.login.side_effect = smtplib.SMTPAuthenticationError(535, b'bad')
+        self.assertFalse(self.manager._test_email_config())
+        self.assertEqual(self.smtp_cls.return_value.login.call_count, 2)
+        self.assertEqual(self.manager._smtp_cache, {})
+
+    def test_concurrent_alerts_do_not_share_the_socket(self):
+        """Alerts from several threads use the cached session one at a time."""
+        active, overlaps = [0], []
+
+        def send(_msg):
+            active[0] += 1
+            overlaps.append(active[0])
+            time.sleep(0.01)
+            active[0] -= 1
+
+        self.smtp_cls.return_value.send_message.side_effect = send
+        threads = [threading.Thread(target=self.manager._send_email_alert, args=('t', 'm', 'info'))
+                   for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(overlaps, [1, 1, 1, 1])
+
+    def test_close_quits_cached_sessions(self):
+        """close() quits every cached session and empties the cache."""
+        self.manager._test_email_config()
+        self.manager.close()
+        self.smtp_cls.return_value.quit.assert_called_once()
+        self.assertEqual(self.manager._smtp_cache, {})
+
+
+class TestSlackWebhookValidation(unittest.TestCase):
+    """Test cases for the Slack webhook allowlist."""
+
+    def test_accepts_slack_webhooks(self):
+        """HTTPS webhooks on Slack hosts are accepted."""
+        self.assertTrue(is_valid_slack_webhook('https://hooks.slack.com/services/T000/B000/XXXX'))
+        self.assertTrue(is_valid_slack_webhook('HTTPS://Hooks.Slack.com/services/T000/B000/XXXX'))
+        self.assertTrue(is_valid_slack_webhook('https://eu.slack.com/api/services/T000'))
+
+    def test_rejects_non_slack_targets(self):
+        """Other schemes, hosts and paths are rejected."""
+        for url in (
+            '',
+            'http://hooks.slack.com/services/T000/B000/XXXX',
+            'https://hooks.slack.com.evil.io/services/T000',
+            'https://evilslack.com/services/T000',
+            'https://slack.com/services/T000',
+            'https://hooks.slack.com/api/T000',
+            'https://hooks.slack.com/x?next=/services/',
+            'https://evil.io/?u=https://hooks.slack.com/services/',
+        ):
+            with self.subTest(url=url):
+                self.assertFalse(is_valid_slack_webhook(url))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -7,7 +7,7 @@ from codesentinel.cli import (
     set_header_for_file,
     set_footer_for_file,
 )
-from codesentinel.cli.doc_utils import _normalize_markdown_whitespace
+from codesentinel.cli.doc_utils import _normalize_markdown_whitespace, _read_origin_url
 
 
 def test_normalize_markdown_whitespace_collapses_excess_blanks():
@@ -63,3 +63,51 @@ Old Footer
     assert text.startswith("# ")
     # Footer should contain SEAM Protected™
     assert "SEAM Protected™" in text
+
+
+def test_read_origin_url_from_git_config(tmp_path: Path):
+    # Not a repository: caller must fall back to git
+    assert _read_origin_url(tmp_path) is None
+
+    git_dir = tmp_path / ".git"
+    git_dir.mkdir()
+    (git_dir / "config").write_text(
+        "[core]\n"
+        "\trepositoryformatversion = 0\n"
+        '[remote "upstream"]\n'
+        "\turl = https://github.com/other/fork.git\n"
+        '[remote "origin"]\n'
+        "\turl = git@github.com:owner/repo.git\n"
+        "\tfetch = +refs/heads/*:refs/remotes/origin/*\n"
+        '[branch "main"]\n'
+        "\tremote = origin\n",
+        encoding="utf-8",
+    )
+    assert _read_origin_url(tmp_path) == "git@github.com:owner/repo.git"
+
+    (git_dir / "config").write_text("[core]\n\tbare = false\n", encoding="utf-8")
+    assert _read_origin_url(tmp_path) == ""
+
+
+def test_read_origin_url_case_and_legacy_forms(tmp_path: Path):
+    git_dir = tmp_path / ".git"
+    git_dir.mkdir()
+    config = git_dir / "config"
+
+    # Section and key names are case-insensitive
+    config.write_text('[Remote "origin"]\n\tURL = https://github.com/owner/repo.git\n', encoding="utf-8")
+    assert _read_origin_url(tmp_path) == "https://github.com/owner/repo.git"
+
+    # Legacy [remote.origin] spelling
+    config.write_text("[remote.origin]\n\turl = https://github.com/owner/repo.git\n", encoding="utf-8")
+    assert _read_origin_url(tmp_path) == "https://github.com/owner/repo.git"
+
+    # Origin present but not cleanly parseable: defer to git instead of "no origin"
+    for text in (
+        '[remote  "origin" ]\n\turl = https://github.com/owner/repo.git\n',
+        '[remote "origin"]\n\tfetch = +refs/heads/*:refs/remotes/origin/*\n',
+        '[remote "origin"]\n\turl = "https://github.com/owner/repo.git"\n',
+        '[remote "origin"]\n\turl = https://a.example/r.git\n\turl = https://b.example/r.git\n',
+    ):
+        config.write_text(text, encoding="utf-8")
+        assert _read_origin_url(tmp_path) is None, text
@@ -0,0 +1,84 @@
+"""Tests for the document formatting configuration GUI tables."""
+
+import os
+import sys
+import unittest
+from unittest import mock
+
+# Add the codesentinel package to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from codesentinel.gui.formatting_config import (
+    _ADVANCED_TOGGLES,
+    _BASIC_FIELDS,
+    _BLANK_LINE_FIELDS,
+    _has_state,
+    FormattingCustomizationPanel,
+)
+
+
+class _Var:
+    """Stand-in for a Tk variable."""
+
+    def __init__(self, value):
+        self.value = value
+
+    def get(self):
+        return self.value
+
+    def set(self, value):
+        self.value = value
+
+
+class TestSetScheme(unittest.TestCase):
+    """Test cases for locking the customization panel by scheme."""
+
+    def setUp(self):
+        """Build a panel shell holding one value per field, without Tk widgets."""
+        self.panel = FormattingCustomizationPanel.__new__(FormattingCustomizationPanel)
+        self.panel.children = {}
+        self.panel.lock_label = mock.Mock()
+        self.panel.custom_locked = True
+        self.panel._applied_lock = None
+        self.panel.setting_vars = {spec[0]: _Var(spec[3]) for spec in _BASIC_FIELDS + _BLANK_LINE_FIELDS}
+        self.panel.setting_vars.update((key, _Var(default)) for key, _label, default in _ADVANCED_TOGGLES)
+
+    def test_custom_values_survive_a_named_scheme(self):
+        """Custom -> Black -> Custom leaves the user's values untouched."""
+        self.panel.set_scheme('custom')
+        self.panel.setting_vars['max_line_length'].set(120)
+        self.panel.setting_vars['quote_style'].set('single')
+        before = self.panel.get_settings()
+        self.panel.set_scheme('black')
+        self.assertTrue(self.panel.custom_locked)
+        self.panel.set_scheme('custom')
+        self.assertFalse(self.panel.custom_locked)
+        self.assertEqual(self.panel.get_settings(), before)
+
+
+class TestHasState(unittest.TestCase):
+    """Test cases for the per-class 'state' option lookup."""
+
+    def test_option_lookup_runs_once_per_class(self):
+        """Tk is asked for a class's options only on its first widget."""
+        calls = []
+
+        class _Entry:
+            def keys(self):
+                calls.append('entry')
+                return ['state', 'width']
+
+        class _Frame:
+            def keys(self):
+                calls.append('frame')
+                return ['width']
+
+        self.assertTrue(_has_state(_Entry()))
+        self.assertTrue(_has_state(_Entry()))
+        self.assertFalse(_has_state(_Frame()))
+        self.assertFalse(_has_state(_Frame()))
+        self.assertEqual(calls, ['entry', 'frame'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,71 @@
+"""Tests for the dependency installer's worker-to-Tk hand-off."""
+
+import os
+import sys
+import threading
+import unittest
+from collections import deque
+from unittest import mock
+
+# Add the codesentinel package to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from codesentinel.gui_launcher import DependencyInstallerGUI
+
+
+class TestPump(unittest.TestCase):
+    """_pump is scheduled on demand and stops once both queues are empty."""
+
+    def setUp(self):
+        self.app = DependencyInstallerGUI.__new__(DependencyInstallerGUI)
+        self.app.root = mock.Mock()
+        self.app.log_text = mock.Mock()
+        self.app.log_text.index.return_value = '3.0'
+        self.app._log_buffer = deque()
+        self.app._ui_calls = deque()
+        self.app._pump_lock = threading.Lock()
+        self.app._pump_armed = False
+
+    def test_post_arms_once(self):
+        callback = mock.Mock()
+        self.app._post(callback, 1)
+        self.app.log_message("line")
+        self.app.root.after.assert_called_once_with(50, self.app._pump)
+        callback.assert_not_called()
+
+    def test_pump_stops_when_drained(self):
+        callback = mock.Mock()
+        self.app._post(callback, 1)
+        self.app.log_message("line")
+        self.app.root.after.reset_mock()
+        self.app._pump()
+        callback.assert_called_once_with(1)
+        self.app.log_text.insert.assert_called_once()
+        self.app.root.after.assert_not_called()
+        self.assertFalse(self.app._pump_armed)
+        # The next post schedules it again
+        self.app._post(callback, 2)
+        self.app.root.after.assert_called_once_with(50, self.app._pump)
+
+    def test_pump_rearms_for_work_queued_meanwhile(self):
+        # Simulate the worker posting while the log insert is in progress
+        self.app.log_text.see.side_effect = lambda *_: self.app._post(mock.Mock())
+        self.app.log_message("line")
+        self.app.root.after.reset_mock()
+        self.app._pump()
+        self.app.root.after.assert_called_once_with(50, self.app._pump)
+        self.assertTrue(self.app._pump_armed)
+
+    def test_failing_callback_does_not_strand_queue(self):
+        def boom():
+            raise RuntimeError("boom")
+        self.app._post(boom)
+        self.app._post(mock.Mock())
+        self.app.root.after.reset_mock()
+        with self.assertRaises(RuntimeError):
+            self.app._pump()
+        self.app.root.after.assert_called_once_with(50, self.app._pump)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,467 @@
+"""Tests for the pure helpers in the CodeSentinel setup wizard."""
+
+import os
+import queue
+import sys
+import tempfile
+import time
+import unittest
+import urllib.error
+from concurrent.futures import Future
+from pathlib import Path
+from unittest import mock
+
+# Add the codesentinel package to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from codesentinel import gui_wizard_v2
+from codesentinel.gui_wizard_v2 import (
+    WizardApp,
+    _detect_ides,
+    _ide_cache_fingerprint,
+    _ide_installed,
+    _ide_enabled,
+    _load_ide_cache,
+    _save_ide_cache,
+    _parse_github_repo,
+    _parse_recipients,
+    _path_matches,
+    _relative_path_display,
+)
+
+
+class TestRelativePathDisplay(unittest.TestCase):
+    """Test cases for the detected-repository path display helper."""
+
+    def setUp(self):
+        """Set up fake cwd/home roots."""
+        self.cwd = os.path.join(os.sep, 'work', 'project')
+        self.home = os.path.join(os.sep, 'home', 'user')
+
+    def test_path_under_cwd(self):
+        """Paths below the working directory are shown as ./relative."""
+        path = os.path.join(self.cwd, 'sub', 'repo')
+        expected = './' + os.path.join('sub', 'repo')
+        self.assertEqual(_relative_path_display(path, self.cwd, self.home), expected)
+
+    def test_path_under_home(self):
+        """Paths below the home directory are shown as ~/relative."""
+        path = os.path.join(self.home, 'code', 'repo')
+        expected = '~/' + os.path.join('code', 'repo')
+        self.assertEqual(_relative_path_display(path, self.cwd, self.home), expected)
+
+    def test_root_cwd_or_home(self):
+        """A filesystem-root cwd or home still yields a relative display."""
+        path = os.path.join(os.sep, 'srv', 'repo')
+        expected = './' + os.path.join('srv', 'repo')
+        self.assertEqual(_relative_path_display(path, os.sep, self.home), expected)
+        expected = '~/' + os.path.join('srv', 'repo')
+        self.assertEqual(_relative_path_display(path, self.cwd, os.sep), expected)
+
+    def test_sibling_prefix_is_not_relative(self):
+        """A sibling sharing the cwd prefix is not treated as relative."""
+        path = self.cwd + '-other'
+        self.assertEqual(_relative_path_display(path, self.cwd, self.home), path)
+
+    def test_long_unrelated_path_is_truncated(self):
+        """Unrelated paths longer than 50 characters are truncated."""
+        path = os.path.join(os.sep, 'opt', 'x' * 80)
+        display = _relative_path_display(path, self.cwd, self.home)
+        self.assertEqual(len(display), 50)
+        self.assertTrue(display.startswith('...'))
+
+
+class TestParseGithubRepo(unittest.TestCase):
+    """Test cases for GitHub repository URL parsing."""
+
+    def test_https_url(self):
+        """Plain and .git-suffixed HTTPS URLs yield owner and repo."""
+        self.assertEqual(_parse_github_repo('https://github.com/joe/CodeSentinel'), ('joe', 'CodeSentinel'))
+        self.assertEqual(_parse_github_repo('https://github.com/joe/CodeSentinel.git'), ('joe', 'CodeSentinel'))
+        self.assertEqual(_parse_github_repo('https://github.com/joe/my.repo/'), ('joe', 'my.repo'))
+
+    def test_ssh_url(self):
+        """SSH remotes are accepted."""
+        self.assertEqual(_parse_github_repo('git@github.com:joe/CodeSentinel.git'), ('joe', 'CodeSentinel'))
+
+    def test_rejects_malformed(self):
+        """Non-GitHub hosts and partial paths are rejected."""
+        self.assertIsNone(_parse_github_repo('https://gitlab.com/joe/repo'))
+        self.assertIsNone(_parse_github_repo('https://github.com/joe'))
+        self.assertIsNone(_parse_github_repo('https://github.com.evil.io/joe/repo'))
+        self.assertIsNone(_parse_github_repo('https://github.com/joe/repo/tree/main'))
+
+
+class TestParseRecipients(unittest.TestCase):
+    """Test cases for the alert recipients field."""
+
+    def test_blanks_and_duplicates_dropped(self):
+        """Empty entries and repeated addresses are removed, order preserved."""
+        self.assertEqual(
+            _parse_recipients(' a@x.io, b@x.io,,a@x.io , '),
+            ['a@x.io', 'b@x.io'],
+        )
+
+    def test_semicolon_separator(self):
+        """Addresses pasted with semicolons are split too."""
+        self.assertEqual(
+            _parse_recipients('a@x.io; b@x.io;c@x.io'),
+            ['a@x.io', 'b@x.io', 'c@x.io'],
+        )
+
+    def test_display_name_kept_whole(self):
+        """Spaces inside a display-name address do not split it."""
+        self.assertEqual(
+            _parse_recipients('Ops Team <ops@x.com>, a@b.com'),
+            ['Ops Team <ops@x.com>', 'a@b.com'],
+        )
+
+    def test_empty_field(self):
+        """An empty field yields no recipients."""
+        self.assertEqual(_parse_recipients(''), [])
+
+
+class TestIdeEnabled(unittest.TestCase):
+    """Test cases for reading IDE step selections."""
+
+    def test_dict_entries_use_enabled_flag(self):
+        """A detected-but-unselected IDE is not enabled."""
+        self.assertTrue(_ide_enabled({'detected': False, 'enabled': True}))
+        self.assertFalse(_ide_enabled({'detected': True, 'enabled': False}))
+
+    def test_legacy_and_missing_entries(self):
+        """Bare booleans are honoured and a missing entry is disabled."""
+        self.assertTrue(_ide_enabled(True))
+        self.assertFalse(_ide_enabled(False))
+        self.assertFalse(_ide_enabled(None))
+
+
+class TestDetectIdes(unittest.TestCase):
+    """Test cases for the installed-IDE scan."""
+
+    def setUp(self):
+        """Create a fake install tree with one JetBrains IDE."""
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.root = tmp.name
+        exe = Path(self.root, 'JetBrains', 'PyCharm 2024.1', 'bin', 'pycharm64.exe')
+        exe.parent.mkdir(parents=True)
+        exe.touch()
+        Path(self.root, 'JetBrains', 'notes.txt').touch()
+
+    def test_wildcard_component_matches_by_prefix(self):
+        """parent/prefix*/rest patterns match only entries with the prefix and the file."""
+        self.assertTrue(_path_matches(f'{self.root}/JetBrains/PyCharm*/bin/pycharm64.exe'))
+        self.assertTrue(_path_matches(f'{self.root}/JetBrains/*/bin/pycharm64.exe'))
+        self.assertFalse(_path_matches(f'{self.root}/JetBrains/IntelliJ IDEA*/bin/idea64.exe'))
+        self.assertFalse(_path_matches(f'{self.root}/JetBrains/PyCharm*/bin/pycharm.exe'))
+        self.assertFalse(_path_matches(f'{self.root}/Missing/PyCharm*/bin/pycharm64.exe'))
+
+    def test_literal_paths_skip_glob(self):
+        """Patterns without a wildcard are a plain existence check."""
+        with mock.patch.object(gui_wizard_v2.glob, 'glob') as fake_glob:
+            self.assertTrue(_path_matches(f'{self.root}/JetBrains/notes.txt'))
+            self.assertFalse(_path_matches(f'{self.root}/JetBrains/missing.txt'))
+        fake_glob.assert_not_called()
+
+    def test_missing_roots_skip_their_patterns(self):
+        """Patterns under a root that is not a live directory are never scanned."""
+        config = {'key': 'PyCharm', 'commands': [],
+                  'paths': [f'{self.root}/JetBrains/PyCharm*/bin/pycharm64.exe']}
+        with mock.patch.object(gui_wizard_v2, '_path_matches') as fake_match:
+            self.assertFalse(_ide_installed(config, live_roots={}))
+        fake_match.assert_not_called()
+        self.assertTrue(_ide_installed(config, live_roots={f'{self.root}/JetBrains': None}))
+
+    def test_stored_listing_replaces_scandir(self):
+        """A listing taken for the root is matched without listing it again."""
+        pattern = f'{self.root}/JetBrains/PyCharm*/bin/pycharm64.exe'
+        with mock.patch.object(gui_wizard_v2.os, 'scandir') as fake_scandir:
+            self.assertTrue(_path_matches(pattern, ('notes.txt', 'PyCharm 2024.1')))
+            self.assertFalse(_path_matches(pattern, ('notes.txt',)))
+        fake_scandir.assert_not_called()
+
+    def test_registry_entries_skip_disk_checks(self):
+        """IDEs named in the uninstall registry are reported without probing paths."""
+        configs = [
+            {'key': 'PyCharm', 'display_names': ('PyCharm',), 'commands': ['pycharm'],
+             'paths': [f'{self.root}/missing/pycharm64.exe']},
+            {'key': 'Atom', 'commands': ['atom'], 'paths': [f'{self.root}/atom/atom.exe']},
+        ]
+        with mock.patch.object(gui_wizard_v2, '_registry_display_names',
+                               return_value=('PyCharm Community Edition 2024.1', 'Git')), \
+                mock.patch.object(gui_wizard_v2, '_ide_installed', return_value=False) as fake_check:
+            self.assertEqual(_detect_ides(configs), {'PyCharm': True, 'Atom': False})
+        self.assertEqual([call.args[0]['key'] for call in fake_check.call_args_list], ['Atom'])
+
+    def test_results_keep_config_order_and_keys(self):
+        """PATH and install-path hits are reported per IDE key."""
+        configs = [
+            {'key': 'VS Code', 'commands': ['code'], 'paths': []},
+            {'key': 'PyCharm', 'commands': ['pycharm'],
+             'paths': [f'{self.root}/JetBrains/PyCharm*/bin/pycharm64.exe']},
+            {'key': 'Atom', 'commands': ['atom'], 'paths': [f'{self.root}/atom/atom.exe']},
+        ]
+        with mock.patch.object(gui_wizard_v2, '_which', side_effect=lambda cmd: '/bin/code' if cmd == 'code' else None):
+            statuses = _detect_ides(configs)
+        self.assertEqual(list(statuses), ['VS Code', 'PyCharm', 'Atom'])
+        self.assertEqual(statuses, {'VS Code': True, 'PyCharm': True, 'Atom': False})
+
+
+class TestIdeCache(unittest.TestCase):
+    """Test cases for the on-disk IDE scan cache."""
+
+    def setUp(self):
+        """Point the cache at a temporary directory."""
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.path = Path(tmp.name) / 'nested' / 'ide_cache.json'
+        patcher = mock.patch.object(gui_wizard_v2, '_IDE_CACHE_PATH', self.path)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_round_trip(self):
+        """Saved results are returned while fresh."""
+        _save_ide_cache({'VS Code': True, 'Atom': False}, 'fp')
+        self.assertEqual(_load_ide_cache(['Atom', 'VS Code'], 'fp'), {'VS Code': True, 'Atom': False})
+
+    def test_missing_stale_or_mismatched_cache_is_ignored(self):
+        """No file, an expired file, a different IDE list or fingerprint all force a rescan."""
+        self.assertIsNone(_load_ide_cache(['VS Code'], 'fp'))
+        _save_ide_cache({'VS Code': True}, 'fp')
+        self.assertIsNone(_load_ide_cache(['VS Code', 'Eclipse'], 'fp'))
+        self.assertIsNone(_load_ide_cache(['VS Code'], 'other'))
+        old = time.time() - gui_wizard_v2._IDE_CACHE_TTL - 1
+        os.utime(self.path, (old, old))
+        self.assertIsNone(_load_ide_cache(['VS Code'], 'fp'))
+
+    def test_fingerprint_tracks_install_roots(self):
+        """Creating or touching an install root changes the fingerprint."""
+        root = self.path.parent / 'Editor'
+        configs = [{'key': 'Editor', 'commands': [], 'paths': [str(root / 'editor.exe')]}]
+        before = _ide_cache_fingerprint(configs)
+        self.assertEqual(_ide_cache_fingerprint(configs), before)
+        root.mkdir(parents=True)
+        created = _ide_cache_fingerprint(configs)
+        self.assertNotEqual(created, before)
+        os.utime(root, (1, 1))
+        self.assertNotEqual(_ide_cache_fingerprint(configs), created)
+
+    def test_scan_uses_fresh_cache_and_refills_stale_one(self):
+        """The startup scan reads a fresh cache and rescans (then saves) otherwise."""
+        keys = [config['key'] for config in gui_wizard_v2._IDE_CONFIGS]
+        detected = dict.fromkeys(keys, False)
+        with mock.patch.object(gui_wizard_v2, '_detect_ides', return_value=detected) as fake_detect:
+            self.assertEqual(gui_wizard_v2._scan_ides(), detected)
+            fingerprint = _ide_cache_fingerprint(gui_wizard_v2._IDE_CONFIGS)
+            self.assertEqual(_load_ide_cache(keys, fingerprint), detected)
+            self.assertEqual(gui_wizard_v2._scan_ides(), detected)
+        fake_detect.assert_called_once()
+
+
+class TestProbeCoalescing(unittest.TestCase):
+    """Test cases for in-flight validation probe handling."""
+
+    def setUp(self):
+        """Build a WizardApp shell without Tk; only probe state is needed."""
+        self.app = WizardApp.__new__(WizardApp)
+        self.app._io_pool = mock.Mock()
+        self.app._ui_queue = mock.Mock()
+        self.app._io_jobs = 0
+        self.app._ui_pump_armed = False
+        self.app.root = mock.Mock()
+        self.app._probes_in_flight = {}
+        self.app.validations = {}
+        self.app.colors = {'success': 'green', 'error': 'red'}
+        self.app._schedule_nav_state = mock.Mock()
+        self.status = mock.Mock()
+
+    def _done(self, result):
+        future = mock.Mock()
+        future.result.return_value = result
+        return future
+
+    def test_repeat_click_with_same_inputs_is_ignored(self):
+        """A second request for inputs already being checked submits nothing."""
+        self.app._run_probe(mock.Mock(), self.status, 'slack', ('https://hooks.slack.com/services/a',))
+        self.app._run_probe(mock.Mock(), self.status, 'slack', ('https://hooks.slack.com/services/a',))
+        self.assertEqual(self.app._io_pool.submit.call_count, 1)
+
+    def test_queue_polling_stops_when_no_jobs_remain(self):
+        """The UI queue timer is armed by a submission and not re-armed once drained."""
+        self.app._ui_queue = queue.Queue()
+        self.app._io_pool.submit.return_value.add_done_callback.side_effect = lambda cb: cb('future')
+        on_done = mock.Mock()
+        self.app._submit_io(mock.Mock(), on_done, 'arg')
+        self.app.root.after.assert_called_once_with(50, self.app._drain_ui_queue)
+
+        self.app._drain_ui_queue()
+        on_done.assert_called_once_with('future', 'arg')
+        self.app.root.after.assert_called_once()
+        self.assertFalse(self.app._ui_pump_armed)
+
+    def test_superseded_result_is_dropped(self):
+        """Only the result for the latest inputs updates the validation flag."""
+        self.app._run_probe(mock.Mock(), self.status, 'github', ('old', ''))
+        self.app._run_probe(mock.Mock(), self.status, 'github', ('new', ''))
+        self.assertEqual(self.app._io_pool.submit.call_count, 2)
+
+        self.app._finish_probe(self._done(("ok", 'success', True)), self.status, 'github', ('old', ''))
+        self.assertNotIn('github', self.app.validations)
+
+        self.app._finish_probe(self._done(("bad", 'error', False)), self.status, 'github', ('new', ''))
+        self.assertFalse(self.app.validations['github'])
+        self.assertEqual(self.app._probes_in_flight, {})
+
+
+class TestGithubProbeCache(unittest.TestCase):
+    """Test cases for reusing GitHub validation results."""
+
+    def setUp(self):
+        """Build a WizardApp shell whose I/O pool runs jobs inline."""
+        self.app = WizardApp.__new__(WizardApp)
+        self.app._io_pool = mock.Mock()
+        self.app._io_pool.submit.side_effect = self._run_inline
+        self.app._ui_queue = queue.Queue()
+        self.app._io_jobs = 0
+        self.app._ui_pump_armed = False
+        self.app.root = mock.Mock()
+        self.app._probes_in_flight = {}
+        self.app._github_probe_cache = {}
+        self.app.validations = {}
+        self.app.colors = {'success': 'green', 'error': 'red', 'processing': 'blue'}
+        self.app._schedule_nav_state = mock.Mock()
+        self.app.github_status = mock.Mock()
+        self.app.gh_url = mock.Mock()
+        self.app.gh_url.get.return_value = 'https://github.com/owner/repo'
+        self.app.gh_token = mock.Mock()
+        self.app.gh_token.get.return_value = ''
+
+    def _run_inline(self, fn):
+        """Record that ``fn`` ran in a worker and return its finished future."""
+        self.assertFalse(self.in_worker)
+        self.in_worker = True
+        future = Future()
+        try:
+            future.set_result(fn())
+        finally:
+            self.in_worker = False
+        return future
+
+    def _validate(self, urlopen):
+        """Run one validation click through the pool and the UI queue."""
+        self.in_worker = False
+        with mock.patch('urllib.request.urlopen', urlopen):
+            self.app._validate_github()
+        self.app._drain_ui_queue()
+
+    def _http_error(self, code):
+        return urllib.error.HTTPError('https://api.github.com', code, 'err', {}, None)
+
+    def test_definitive_answer_is_cached_on_the_tk_thread(self):
+        """A 404 is cached, but only once the result reaches _finish_probe."""
+        writes = []
+        cache = self.app._github_probe_cache = mock.MagicMock(wraps={})
+        cache.__setitem__.side_effect = lambda *a: writes.append(self.in_worker)
+        cache.get.return_value = None
+        self._validate(mock.Mock(side_effect=self._http_error(404)))
+        self.assertEqual(writes, [False])
+        self.assertFalse(self.app.validations['github'])
+
+    def test_cached_answer_skips_the_network(self):
+        """A repeat click within the TTL reuses a successful lookup."""
+        response = mock.Mock(status=200)
+        urlopen = mock.Mock(return_value=response)
+        self._validate(urlopen)
+        self._validate(urlopen)
+        urlopen.assert_called_once()
+        self.assertTrue(self.app.validations['github'])
+
+    def test_transient_failures_are_not_cached(self):
+        """Server errors and rate limits are retried on the next click."""
+        for code in (500, 429, 403):
+            urlopen = mock.Mock(side_effect=self._http_error(code))
+            self._validate(urlopen)
+            self._validate(urlopen)
+            self.assertEqual(urlopen.call_count, 2, code)
+        self.assertEqual(self.app._github_probe_cache, {})
+
+
+class TestHeadlessGuard(unittest.TestCase):
+    """Test cases for the no-display fast path."""
+
+    def test_wizard_refuses_to_start_without_display(self):
+        """WizardApp raises before creating a Tk root when headless on Linux."""
+        env = {k: v for k, v in os.environ.items() if k not in ('DISPLAY', 'WAYLAND_DISPLAY')}
+        with mock.patch.dict(os.environ, env, clear=True), \
+                mock.patch.object(sys, 'platform', 'linux'), \
+                mock.patch('codesentinel.gui_wizard_v2.tk.Tk') as tk_root:
+            with self.assertRaises(RuntimeError):
+                WizardApp()
+            tk_root.assert_not_called()
+
+    def test_project_setup_wizard_shares_the_guard(self):
+        """ProjectSetupWizard applies the same headless check before creating Tk."""
+        from codesentinel.gui_project_setup import ProjectSetupWizard
+        with mock.patch('codesentinel.gui_project_setup.display_available', return_value=False), \
+                mock.patch('codesentinel.gui_project_setup.tk.Tk') as tk_root:
+            with self.assertRaises(RuntimeError):
+                ProjectSetupWizard()
+            tk_root.assert_not_called()
+
+
+class TestIdeStepNavigation(unittest.TestCase):
+    """Test cases for leaving the IDE step while the scan runs."""
+
+    def test_next_disabled_until_rows_drawn(self):
+        """Next is disabled on the IDE step until the scan results are shown."""
+        app = WizardApp.__new__(WizardApp)
+        app.current = 3
+        app.steps = (None,) * 8
+        app.next_btn = mock.Mock()
+        app._nav_pending = True
+        app._ide_rows_ready = False
+        app._update_nav_state()
+        app.next_btn.config.assert_called_with(state="disabled", text="Scanning IDEs...")
+        app._ide_rows_ready = True
+        app._update_nav_state()
+        app.next_btn.config.assert_called_with(state="normal", text="Next →")
+
+
+class TestFinish(unittest.TestCase):
+    """Test cases for the Finish button."""
+
+    def setUp(self):
+        """Build a wizard shell with mocked Tk widgets."""
+        self.app = WizardApp.__new__(WizardApp)
+        self.app.root = mock.Mock()
+        self.app.next_btn = mock.Mock()
+        self.app.back_btn = mock.Mock()
+
+    def test_buttons_disabled_and_redraw_flushed_before_saving(self):
+        """Saving starts with both buttons disabled and only idle tasks flushed."""
+        def save():
+            self.app.next_btn.config.assert_called_with(state="disabled", text="Finishing...")
+            self.app.back_btn.state.assert_called_with(["disabled"])
+            self.app.root.update_idletasks.assert_called_once()
+            return Path('codesentinel.json')
+
+        with mock.patch.object(self.app, '_save_configuration', side_effect=save), \
+                mock.patch.object(gui_wizard_v2.messagebox, 'showinfo'):
+            self.app._save_and_finish()
+        self.app.root.update.assert_not_called()
+        self.app.root.destroy.assert_called_once()
+
+    def test_failed_save_restores_navigation(self):
+        """A save error re-enables Back and recomputes the Finish button."""
+        with mock.patch.object(self.app, '_save_configuration', side_effect=OSError('read-only')), \
+                mock.patch.object(self.app, '_update_nav_state') as update_nav:
+            with self.assertRaises(OSError):
+                self.app._save_and_finish()
+        self.app.back_btn.state.assert_called_with(["!disabled"])
+        update_nav.assert_called_once()
+        self.app.root.destroy.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()